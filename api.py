@@ -0,0 +1,206 @@
+"""Headless JSON API over the core scoring, normalization, resume and job modules.
+
+    uvicorn api:app --host 0.0.0.0 --port 8000 --workers 4
+
+Each uvicorn worker owns a process pool for CPU-bound work (PDF extraction,
+ranking). The compiled occupation index is built once per process, and every
+process (pool workers included) polls the data files for hot reload. Concurrent
+/rank requests are micro-batched into a single pool task; a worker whose data
+version differs from the request's reloads first, so a memoized ranking always
+comes from the data version in its key.
+
+Env vars:
+    API_POOL_WORKERS     processes per uvicorn worker (default: CPU count)
+    API_BATCH_WINDOW_MS  how long /rank waits to fill a batch (default: 2)
+    API_MAX_BATCH        max /rank requests per batch (default: 64)
+    RANK_MEMO_SIZE       rankings kept in the shared LRU memo (default: 4096)
+    DATA_RELOAD_INTERVAL seconds between data file checks for hot reload (default: 5, 0 = off)
+"""
+import asyncio, io, os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+
+from dotenv import load_dotenv
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+from core import metrics
+from core.job_scraper import job_scraper
+from core.normalize import normalize_skills
+from core.resume import extract_text_from_pdf
+from core.scoring import get_index, ranking_memo
+from core.registry import get_catalog, registry
+
+load_dotenv()
+
+POOL_WORKERS = int(os.getenv("API_POOL_WORKERS", os.cpu_count() or 1))
+BATCH_WINDOW = float(os.getenv("API_BATCH_WINDOW_MS", "2")) / 1000
+MAX_BATCH = int(os.getenv("API_MAX_BATCH", "64"))
+MAX_PDF_BYTES = 10 * 1024 * 1024
+
+# --- Pool tasks (module-level so they pickle) ---
+
+def _init_worker():
+    get_index()
+
+def _rank_batch(requests: list[tuple[list[str], int, str]]) -> list[list[dict] | None]:
+    """Rankings for (skills, top_k, index version) requests; None where this worker's data is a different version."""
+    index = get_index()
+    if any(version != index.version for *_, version in requests):
+        # The request saw a reload this worker's watcher hasn't picked up yet
+        registry.reload()
+        index = get_index()
+    # One sparse product for the whole batch; rankings are stable, so slicing to each top_k is exact
+    top_k = max(k for _, k, _ in requests)
+    ranked = index.rank_many([skills for skills, _, _ in requests], top_k)
+    return [matches[:k] if version == index.version else None
+            for matches, (_, k, version) in zip(ranked, requests)]
+
+def _extract_pdf(data: bytes) -> str:
+    return extract_text_from_pdf(io.BytesIO(data))
+
+class RankBatcher:
+    """Collects concurrent rank requests for a few ms and scores them in one pool task."""
+
+    def __init__(self, pool: ProcessPoolExecutor):
+        self.pool = pool
+        self.queue = asyncio.Queue()
+        self.task = None
+
+    def start(self):
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+
+    async def rank(self, skills: list[str], top_k: int, version: str) -> list[dict] | None:
+        """Matches from an index of the given version, or None if the worker has different data."""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(((skills, top_k, version), future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + BATCH_WINDOW
+            while len(batch) < MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            asyncio.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch: list):
+        loop = asyncio.get_running_loop()
+        try:
+            with metrics.span("api.rank_batch"):
+                results = await loop.run_in_executor(self.pool, _rank_batch, [req for req, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_index()
+    app.state.pool = ProcessPoolExecutor(max_workers=POOL_WORKERS, initializer=_init_worker)
+    app.state.batcher = RankBatcher(app.state.pool)
+    app.state.batcher.start()
+    yield
+    await app.state.batcher.stop()
+    app.state.pool.shutdown(wait=False, cancel_futures=True)
+
+app = FastAPI(title="Career & Education Advisor API", lifespan=lifespan)
+
+# --- Schemas ---
+
+class SkillsIn(BaseModel):
+    skills: list[str] = Field(..., max_length=1000)
+
+class RankIn(BaseModel):
+    skills: list[str] = Field(..., max_length=1000)
+    top_k: int = Field(5, ge=1, le=500)
+    normalize: bool = False
+    expand_implied: bool = False
+
+class JobsIn(BaseModel):
+    role: str
+    skills: list[str] = []
+    location: str = ""
+    max_results: int = Field(15, ge=1, le=50)
+    occupation: str | None = None
+
+# --- Endpoints ---
+
+@app.get("/health")
+def health():
+    return {"status": "ok", "occupations": len(get_index().occupations), "rank_memo": ranking_memo.stats()}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    return metrics.render_prometheus()
+
+@app.post("/normalize")
+def normalize(body: SkillsIn):
+    # Sync endpoint: FastAPI runs it in its threadpool, keeping the event loop free
+    return {"skills": normalize_skills(body.skills)}
+
+def _prepare_rank(body: RankIn) -> tuple[list[str], list[str], tuple]:
+    """(skills, skills to score, memo key); fuzzy normalization over up to 1000 skills is CPU-bound."""
+    catalog = get_catalog()  # one snapshot for the whole request
+    skills = normalize_skills(body.skills, catalog.taxonomy) if body.normalize else body.skills
+    scored = sorted(catalog.hierarchy.expand(skills)) if body.expand_implied else skills
+    return skills, scored, ranking_memo.key(catalog.index, scored, body.top_k)
+
+@app.post("/rank")
+async def rank(body: RankIn, request: Request):
+    if body.normalize or body.expand_implied or len(body.skills) > 50:
+        # Off the event loop, so a large request doesn't stall other connections and the batcher
+        skills, scored, key = await run_in_threadpool(_prepare_rank, body)
+    else:
+        skills, scored, key = _prepare_rank(body)
+    # Repeated skill sets are answered from the shared memo without a pool round trip
+    matches = ranking_memo.get(key)
+    if matches is None:
+        matches = await request.app.state.batcher.rank(scored, body.top_k, key[0])
+        if matches is None:
+            # The worker has newer data than this process has polled; catch up and retry once
+            await run_in_threadpool(registry.reload)
+            skills, scored, key = await run_in_threadpool(_prepare_rank, body)
+            matches = await request.app.state.batcher.rank(scored, body.top_k, key[0])
+            if matches is None:
+                raise HTTPException(503, "Occupation data is being reloaded; retry shortly")
+        # Only a result from the key's own data version is memoized
+        ranking_memo.put(key, matches)
+    return {"skills": skills, "matches": matches}
+
+@app.post("/resume/extract")
+async def resume_extract(request: Request):
+    """Body is the raw PDF (Content-Type: application/pdf)."""
+    data = await request.body()
+    if not data:
+        raise HTTPException(400, "Empty body; send the PDF bytes")
+    if len(data) > MAX_PDF_BYTES:
+        raise HTTPException(413, "PDF too large")
+    loop = asyncio.get_running_loop()
+    try:
+        text = await loop.run_in_executor(request.app.state.pool, _extract_pdf, data)
+    except Exception as e:
+        raise HTTPException(422, f"Could not read PDF: {e}")
+    return {"text": text}
+
+@app.post("/jobs")
+def jobs(body: JobsIn):
+    return {"jobs": job_scraper.recommend_jobs(body.role, body.skills, body.location,
+                                               body.max_results, body.occupation)}
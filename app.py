@@ -1,13 +1,13 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from dotenv import load_dotenv
-from core.scoring import load_occupations
-import random
+from core import warmup
+from core.transcripts import retention
 
 load_dotenv()
 
+# Build the shared catalog, indexes and heavy imports off the request path, once per process
+warmup.start()
+
 st.set_page_config(
     page_title="Career & Education Advisor", 
     page_icon="🎯", 
@@ -20,7 +20,7 @@ defaults = {
     "user_profile": {},
     "skills": [],
     "matches": [],
-    "roadmap": "",
+    "roadmap": None,  # core.roadmap.Roadmap once generated
 }
 for k, v in defaults.items():
     if k not in st.session_state:
@@ -50,9 +50,13 @@ else:
 
 st.sidebar.divider()
 st.sidebar.caption("💡 **Tip:** Complete pages in order for the best experience")
-st.sidebar.caption("🔄 No data is stored. Refresh to clear session.")
+st.sidebar.caption(f"🔄 Your profile lives only in this session. AI Coach chats are saved on the server "
+                   f"for {retention()}; Reset Session deletes yours.")
 
 if st.sidebar.button("🔄 Reset Session", use_container_width=True):
+    if st.session_state.get("transcript") is not None:
+        st.session_state.transcript.delete()
+    st.query_params.clear()
     st.session_state.clear()
     st.rerun()
 
@@ -124,4 +128,6 @@ else:
 
 # Footer
 st.markdown("---")
-st.caption("🔒 Privacy-First: All processing happens locally. No personal data is stored or transmitted.")
\ No newline at end of file
+st.caption(f"🔒 Privacy: your resume text, skills and coach messages are sent to Google Gemini to generate "
+           f"results. Only AI Coach conversations are stored, on this server for {retention()}, and anyone with "
+           f"a conversation's link can reopen it. Delete one from the coach page or with Reset Session.")
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""Offline batch scoring: resumes in, ranked roles out, using every core.
+
+    python batch_score.py resumes/ results.jsonl
+    python batch_score.py cohort.jsonl results.jsonl --extractor vocab --workers 8
+    python batch_score.py resumes/ results.jsonl --llm-concurrency 16 --top-k 10
+
+Input is either a directory (*.pdf and *.txt, recursively) or a JSONL file whose
+rows carry an "id" plus one of "text", "path" (PDF/TXT) or "skills".
+
+Skills come from Gemini (--extractor llm, the default, same as the Profile page)
+or from matching the known skill vocabulary in the text (--extractor vocab, no
+API key needed). Results are appended to the output JSONL as they finish. Rerunning
+with the same output skips records that already succeeded, so an interrupted run
+can simply be restarted.
+"""
+import argparse, asyncio, json, os, pathlib, re, sys, time
+from concurrent.futures import ProcessPoolExecutor
+
+from dotenv import load_dotenv
+
+from core.normalize import normalize_skills
+from core.resume import extract_text_from_pdf
+from core.scoring import get_index, rank_cached
+
+load_dotenv()
+
+def iter_records(source: pathlib.Path):
+    """Streams {"id", ...} records from a directory of resumes or a JSONL export."""
+    if source.is_dir():
+        for path in sorted(source.rglob("*")):
+            if path.suffix.lower() in {".pdf", ".txt"}:
+                yield {"id": str(path.relative_to(source)), "path": str(path)}
+        return
+    with open(source, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if line.strip():
+                row = json.loads(line)
+                row.setdefault("id", f"line-{line_no}")
+                yield row
+
+def completed_ids(output: pathlib.Path) -> set:
+    """Ids already scored successfully in a previous (possibly interrupted) run."""
+    done = set()
+    if output.exists():
+        with open(output, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # a torn last line from a killed run
+                if "error" not in row:
+                    done.add(row["id"])
+    return done
+
+# --- Process pool tasks ---
+
+_vocab_pattern = None
+
+def _init_worker():
+    get_index()
+
+def _load_text(record: dict) -> str:
+    if "text" in record:
+        return record["text"]
+    path = pathlib.Path(record["path"])
+    if path.suffix.lower() == ".pdf":
+        with open(path, "rb") as f:
+            return extract_text_from_pdf(f)
+    return path.read_text(encoding="utf-8", errors="ignore")
+
+def _vocab_skills(text: str) -> list[str]:
+    """Known catalog skills mentioned in the text (whole-word, case-insensitive)."""
+    global _vocab_pattern
+    if _vocab_pattern is None:
+        names = sorted(get_index().skills, key=len, reverse=True)
+        _vocab_pattern = re.compile(
+            r"(?<![\w+#])(" + "|".join(re.escape(n) for n in names) + r")(?![\w+#])", re.IGNORECASE)
+    canonical = {s.lower(): s for s in get_index().skills}
+    return sorted({canonical[m.lower()] for m in _vocab_pattern.findall(text)})
+
+def _score(skills: list[str], top_k: int) -> dict:
+    skills = normalize_skills(skills)
+    matches = rank_cached(skills, top_k)
+    return {
+        "skills": skills,
+        "matches": [{"occupation": m["occupation"], "score": m["score"], "gaps": m["gaps"]} for m in matches],
+    }
+
+def _extract_and_score(record: dict, top_k: int) -> dict:
+    """Whole pipeline in one pool task when no LLM call is needed."""
+    skills = record.get("skills")
+    if skills is None:
+        skills = _vocab_skills(_load_text(record))
+    return _score(skills, top_k)
+
+class BatchRunner:
+    def __init__(self, args):
+        self.args = args
+        self.pool = ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker)
+        self.llm_slots = asyncio.Semaphore(args.llm_concurrency)
+        self.inflight = asyncio.Semaphore(args.workers * 4)
+        self.done = self.failed = self.skipped = 0
+        self.started = time.perf_counter()
+        self.last_report = self.started
+
+    async def process(self, record: dict) -> dict:
+        loop = asyncio.get_running_loop()
+        top_k = self.args.top_k
+        if self.args.extractor == "vocab" or "skills" in record:
+            return await loop.run_in_executor(self.pool, _extract_and_score, record, top_k)
+        text = await loop.run_in_executor(self.pool, _load_text, record)
+        async with self.llm_slots:
+            from core import llm
+            raw_skills = await asyncio.to_thread(llm.extract_skills, text)
+        return await loop.run_in_executor(self.pool, _score, raw_skills, top_k)
+
+    async def handle(self, record: dict, out):
+        try:
+            row = {"id": record["id"], **await self.process(record)}
+            self.done += 1
+        except Exception as e:
+            row = {"id": record["id"], "error": f"{type(e).__name__}: {e}"}
+            self.failed += 1
+        finally:
+            self.inflight.release()
+        # Writes happen on the event loop thread, so lines never interleave
+        out.write(json.dumps(row) + "\n")
+        out.flush()
+        self.report()
+
+    def report(self, final: bool = False):
+        now = time.perf_counter()
+        if not final and now - self.last_report < self.args.report_every:
+            return
+        self.last_report = now
+        elapsed = now - self.started
+        rate = self.done / elapsed if elapsed else 0
+        print(f"[{elapsed:7.1f}s] scored {self.done}, failed {self.failed}, skipped {self.skipped} "
+              f"({rate:.1f} resumes/s)", file=sys.stderr, flush=True)
+
+    async def run(self, source: pathlib.Path, output: pathlib.Path):
+        done = completed_ids(output)
+        tasks = set()
+        with open(output, "a", encoding="utf-8") as out:
+            for record in iter_records(source):
+                if record["id"] in done:
+                    self.skipped += 1
+                    continue
+                # Bound in-flight work so huge inputs stream instead of loading at once
+                await self.inflight.acquire()
+                task = asyncio.create_task(self.handle(record, out))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+        self.pool.shutdown()
+        self.report(final=True)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", type=pathlib.Path, help="directory of resumes or a JSONL file")
+    parser.add_argument("output", type=pathlib.Path, help="JSONL results file (appended to, resumable)")
+    parser.add_argument("--extractor", choices=["llm", "vocab"], default="llm")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes for PDF and scoring work")
+    parser.add_argument("--llm-concurrency", type=int, default=8, help="max concurrent Gemini calls")
+    parser.add_argument("--report-every", type=float, default=5.0, help="seconds between progress lines")
+    args = parser.parse_args(argv)
+
+    if not args.source.exists():
+        parser.error(f"{args.source} does not exist")
+    runner = BatchRunner(args)
+    asyncio.run(runner.run(args.source, args.output))
+    return 1 if runner.failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Synthetic inputs for the benchmark suite. Everything is generated locally and seeded."""
+import random
+
+from generate_synthetic_dataset import iter_occupations, iter_profiles
+
+COMPANIES = ["Microsoft", "Google", "Amazon", "Stripe", "Deloitte", "Accenture", "NVIDIA", "IBM"]
+LOCATIONS = ["San Francisco, CA", "New York, NY", "Austin, TX", "Remote", "Hybrid", "Seattle, WA"]
+
+def make_skills(n: int, seed: int = 0) -> list[str]:
+    """Unique skill names, plus a few alias spellings the taxonomy knows about."""
+    rng = random.Random(seed)
+    base = ["Python", "SQL", "Excel", "AWS", "Docker", "Linux", "Git", "Tableau", "React", "Statistics"]
+    aliases = ["ms excel", "postgres", "py", "git version control", "statistics & probability"]
+    skills = []
+    for i in range(n):
+        if i < len(base):
+            skills.append(base[i])
+        elif rng.random() < 0.05:
+            skills.append(rng.choice(aliases))
+        else:
+            skills.append(f"Skill {i:05d}")
+    return skills
+
+def make_occupations(n: int, vocab_size: int = 2000, seed: int = 0) -> list[dict]:
+    """Realistic occupations (Zipfian, clustered skills) from generate_synthetic_dataset.py."""
+    return list(iter_occupations(n, vocab_size, seed))
+
+def make_profiles(n: int, vocab_size: int = 2000, seed: int = 0) -> list[list[str]]:
+    """User skill lists drawn from the same skill space as make_occupations."""
+    return [p["skills"] for p in iter_profiles(n, vocab_size, seed)]
+
+def make_jobs(n: int, seed: int = 0) -> list[dict]:
+    """Job postings shaped like JobScraper._generate_realistic_jobs output."""
+    rng = random.Random(seed)
+    lows = [60, 70, 80, 90, 100, 110, 120, 130]
+    jobs = []
+    for i in range(n):
+        low = rng.choice(lows)
+        jobs.append({
+            "title": f"Engineer {i % 50}",
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(LOCATIONS),
+            "salary": f"${low},000 - ${low + rng.choice([30, 50, 70])},000",
+            "source": "LinkedIn",
+            "job_type": "Full-time",
+            "experience_level": "Mid Level",
+        })
+    return jobs
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def make_pdf(pages: int, lines_per_page: int = 40, seed: int = 0) -> bytes:
+    """A minimal multi-page text PDF, so extraction benchmarks need no fixtures or extra packages."""
+    rng = random.Random(seed)
+    words = make_skills(200, seed) + ["experience", "led", "built", "team", "project", "data", "years"]
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for _ in range(pages):
+        lines = [" ".join(rng.choice(words) for _ in range(10)) for _ in range(lines_per_page)]
+        ops = ["BT", "/F1 10 Tf", "12 TL", "50 780 Td"]
+        ops += [f"({_pdf_escape(line)}) Tj T*" for line in lines]
+        ops.append("ET")
+        stream = "\n".join(ops)
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+        content_ref = len(objects)
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_ref} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{num} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    out += "".join(f"{off:010d} 00000 n \n" for off in offsets).encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    return bytes(out)
+
+def make_hierarchy(n: int, fanout: int = 4, seed: int = 0) -> dict:
+    """Tree-shaped {skill: [implied skills]} edges over n nodes, with ~10% extra cross links."""
+    rng = random.Random(seed)
+    edges = {}
+    for i in range(1, n):
+        implied = [f"Skill {(i - 1) // fanout:05d}"]
+        if rng.random() < 0.1:
+            implied.append(f"Skill {rng.randrange(n):05d}")
+        edges[f"Skill {i:05d}"] = implied
+    return edges
@@ -0,0 +1,93 @@
+"""Import-time budget check for the Streamlit entry points.
+
+Runs each script's top-level imports in a fresh interpreter under `python -X importtime`
+and compares what they cost on top of a bare `import streamlit` against a budget, so
+heavy imports can't creep back onto the cold-start path. Streamlit itself (~250-400 ms
+depending on the machine) is paid once per server, not per page, and is left out so
+its variance doesn't decide the result:
+
+    python -m benchmarks.import_time                 # check every page against its budget
+    python -m benchmarks.import_time --top 10        # also list the slowest imports per page
+    python -m benchmarks.import_time --budget-ms 400 # override the budget for all pages
+
+The exit code is 1 when any page is over budget.
+"""
+import argparse, ast, os, pathlib, statistics, subprocess, sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+ENTRY_POINTS = ["app.py", *sorted(str(p.relative_to(ROOT)) for p in (ROOT / "pages").glob("*.py"))]
+
+# Milliseconds above `import streamlit`. numpy + scipy.sparse (the index) are ~200 ms;
+# pandas + plotly are only imported when a chart misses the figure cache (core.charts).
+# Budgets sit ~50% over what each page measures, so only a new heavy import trips them.
+BASELINE = "import streamlit"
+DEFAULT_BUDGET_MS = 400
+BUDGETS_MS = {"app.py": 50, "pages/4_AI_Coach.py": 50}
+
+# Interpreter startup, not the script's imports
+IGNORED = {"site", "encodings", "_frozen_importlib_external"}
+
+def top_level_imports(path: pathlib.Path) -> str:
+    """Source of the module-level import statements in a script."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+def measure(code: str, baseline: str = BASELINE) -> tuple[float, list[tuple[float, str]]]:
+    """(ms, [(cumulative ms, module)] for top-level imports) in a fresh interpreter, after the baseline imports."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"{baseline}\n{code}"], cwd=ROOT, env=env,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    baseline_modules = {name.split(".")[0] for name in _imported_names(baseline)}
+    modules, in_baseline = [], bool(baseline_modules)
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented under their parent; only count the outermost ones
+        if name.startswith("  ") or name.strip() in IGNORED:
+            continue
+        if in_baseline:
+            # A module is logged when it finishes, so everything up to the baseline's own line is its cost
+            baseline_modules.discard(name.strip())
+            in_baseline = bool(baseline_modules)
+            continue
+        modules.append((int(cumulative) / 1000, name.strip()))
+    return sum(ms for ms, _ in modules), modules
+
+def _imported_names(code: str) -> list[str]:
+    names = []
+    for node in ast.parse(code).body:
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            names.append(node.module)
+    return names
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, help="override every page's budget")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per page; the median is reported")
+    parser.add_argument("--top", type=int, default=0, help="show the N slowest imports per page")
+    args = parser.parse_args(argv)
+
+    over = []
+    for entry in ENTRY_POINTS:
+        code = top_level_imports(ROOT / entry)
+        runs = [measure(code) for _ in range(args.repeat)]
+        total = statistics.median(ms for ms, _ in runs)
+        budget = args.budget_ms or BUDGETS_MS.get(entry, DEFAULT_BUDGET_MS)
+        status = "OK  " if total <= budget else "OVER"
+        print(f"{status} {entry:<32} {total:8.1f} ms  (budget {budget:g} ms)")
+        for ms, name in sorted(runs[-1][1], reverse=True)[:args.top]:
+            print(f"       {ms:8.1f} ms  {name}")
+        if total > budget:
+            over.append(entry)
+    if over:
+        print(f"\n{len(over)} entry point(s) over budget: {', '.join(over)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
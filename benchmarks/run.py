@@ -0,0 +1,196 @@
+"""Benchmark suite for the scoring, normalization, extraction and job pipelines.
+
+Run from the repository root (core modules read data/ via relative paths):
+
+    python -m benchmarks.run --quick                 # small scales only
+    python -m benchmarks.run --save main             # write benchmarks/baselines/main.json
+    python -m benchmarks.run --compare main          # flag cases slower than the baseline
+    python -m benchmarks.run --filter rank_roles --threshold 0.1
+
+The exit code is 1 when --compare finds a regression, so it can gate CI.
+"""
+import argparse, io, json, pathlib, platform, statistics, sys, time, types
+
+from benchmarks.datasets import make_hierarchy, make_jobs, make_occupations, make_pdf, make_profiles, make_skills
+
+BASELINE_DIR = pathlib.Path(__file__).parent / "baselines"
+
+SCALES = {
+    "occupations": [10, 1_000, 10_000, 100_000],
+    "skills": [10, 100, 1_000, 10_000],
+    "pdf_pages": [1, 10, 100],
+    "jobs": [10, 1_000, 100_000, 1_000_000],
+    "hierarchy": [1_000, 50_000],
+    "vocabulary": [1_000, 100_000],
+}
+QUICK_SCALES = {
+    "occupations": [10, 1_000],
+    "skills": [10, 100],
+    "pdf_pages": [1, 10],
+    "jobs": [10, 1_000],
+    "hierarchy": [1_000],
+    "vocabulary": [1_000],
+}
+
+def install_llm_stub():
+    """Replaces core.llm with a deterministic offline stub (no API key or network needed)."""
+    stub = types.ModuleType("core.llm")
+
+    def extract_skills(text: str):
+        words = [w.strip(".,") for w in text.split()]
+        return sorted({w for w in words if w[:1].isupper()})[:25]
+
+    stub.extract_skills = extract_skills
+    stub._call_gemini = lambda prompt, json_output=False: ""
+    sys.modules["core.llm"] = stub
+    return stub
+
+def measure(fn, min_time: float = 0.2, repeat: int = 5) -> dict:
+    """Times fn() with enough inner loops to exceed min_time, repeat times. Slow cases run once."""
+    start = time.perf_counter()
+    fn()
+    first = time.perf_counter() - start
+    if first > 1.0:
+        return {"median": first, "min": first, "loops": 1, "runs": 1}
+    loops = max(1, int(min_time / max(first, 1e-6)))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return {"median": statistics.median(samples), "min": min(samples), "loops": loops, "runs": repeat}
+
+def build_cases(scales: dict):
+    """Yields (name, zero-arg callable) pairs. Inputs are built before timing starts."""
+    from core.normalize import normalize_skills
+    from core.resume import extract_text_from_pdf
+    from core.scoring import rank_roles
+    from core.index import IncrementalScorer, OccupationIndex
+    from core.cooccurrence import SkillGraph
+    from core.hierarchy import SkillHierarchy
+    from core.autocomplete import SkillCompleter
+    from core.job_scraper import JobScraper
+    from core.salary import SalaryStats
+    llm = install_llm_stub()
+    scraper = JobScraper()
+
+    cohort = make_profiles(1_000)
+    user_skills = cohort[0]
+    for n in scales["occupations"]:
+        occs = make_occupations(n)
+        index = OccupationIndex(occs)
+        yield f"rank_roles[occupations={n}]", lambda occs=occs: rank_roles(user_skills, occs, top_k=len(occs))
+        yield f"rank_many[users=1000,occupations={n}]", lambda index=index: index.rank_many(cohort, top_k=5)
+        scorer = IncrementalScorer(index, user_skills)
+        extra = index.skills[0]
+        yield f"incremental_edit[occupations={n}]", lambda scorer=scorer, extra=extra: (
+            scorer.add(extra), scorer.remove(extra), scorer.top(5))
+        graph = SkillGraph.from_occupations(occs)
+        graph.normalized
+        yield f"complementary_skills[occupations={n}]", lambda graph=graph: graph.complementary(user_skills, n=5)
+
+    for n in scales["skills"]:
+        skills = make_skills(n)
+        yield f"normalize_skills[skills={n}]", lambda skills=skills: normalize_skills(skills)
+
+    for n in scales["hierarchy"]:
+        edges = make_hierarchy(n)
+        hierarchy = SkillHierarchy(edges)
+        held = [f"Skill {i:05d}" for i in range(n - 20, n)]
+        yield f"hierarchy_closure[nodes={n}]", lambda edges=edges: SkillHierarchy(edges)
+        yield f"expand_implied[nodes={n}]", lambda hierarchy=hierarchy, held=held: hierarchy.expand(held)
+
+    for n in scales["vocabulary"]:
+        completer = SkillCompleter({skill: i % 97 for i, skill in enumerate(make_skills(n))})
+        yield f"autocomplete_prefix[skills={n}]", lambda completer=completer: completer.complete("skill 00")
+        yield f"autocomplete_fuzzy[skills={n}]", lambda completer=completer: completer.complete("skil 0x0")
+
+    from core.charts import FigureCache, _build_bar
+    charts = FigureCache()
+    rows = [{"Skill": skill, "Frequency": i} for i, skill in enumerate(make_skills(10))]
+    _build_bar(rows, x="Frequency", y="Skill", title="Top skills")  # imports pandas + plotly untimed
+    yield "bar_chart_build", lambda: _build_bar(rows, x="Frequency", y="Skill", title="Top skills")
+    yield "bar_chart_cached", lambda: charts.get_or_build("bar", rows, _build_bar, x="Frequency", y="Skill",
+                                                          title="Top skills")
+
+    for pages in scales["pdf_pages"]:
+        pdf = make_pdf(pages)
+        yield f"extract_text_from_pdf[pages={pages}]", lambda pdf=pdf: extract_text_from_pdf(io.BytesIO(pdf))
+
+    occs = make_occupations(1_000)
+    pdf = make_pdf(2)
+
+    def profile_pipeline():
+        text = extract_text_from_pdf(io.BytesIO(pdf))
+        skills = normalize_skills(llm.extract_skills(text))
+        return rank_roles(skills, occs, top_k=5)
+    yield "profile_pipeline[pages=2,occupations=1000]", profile_pipeline
+
+    for n in scales["jobs"]:
+        jobs = make_jobs(n)
+        calls = max(1, min(n // 12, 10_000))
+        yield f"job_generation[jobs={calls * 12}]", lambda calls=calls: [
+            scraper._generate_realistic_jobs("Data Analyst", user_skills, "", 12) for _ in range(calls)]
+        yield f"average_salary[jobs={n}]", lambda jobs=jobs: scraper._calculate_average_salary(jobs)
+        yield f"salary_ingest[jobs={n}]", lambda jobs=jobs: SalaryStats().ingest(jobs, "Data Analyst")
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Prints a comparison table and returns the names of regressed cases."""
+    regressions = []
+    print(f"\n{'case':55} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name, res in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"{name:55} {'-':>12} {_fmt(res['median']):>12} {'new':>9}")
+            continue
+        change = res["median"] / base["median"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  improved"
+        print(f"{name:55} {_fmt(base['median']):>12} {_fmt(res['median']):>12} {change:>+8.1%}{flag}")
+    return regressions
+
+def _fmt(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="only run the small scales")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--save", metavar="NAME", help="save results as a named baseline")
+    parser.add_argument("--compare", metavar="NAME", help="compare against a named baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before flagging (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, fn in build_cases(QUICK_SCALES if args.quick else SCALES):
+        if args.filter not in name:
+            continue
+        results[name] = measure(fn)
+        print(f"{name:55} {_fmt(results[name]['median']):>12}", flush=True)
+
+    if args.save:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        path = BASELINE_DIR / f"{args.save}.json"
+        path.write_text(json.dumps({"python": platform.python_version(), "machine": platform.machine(),
+                                    "results": results}, indent=2), encoding="utf-8")
+        print(f"\nSaved baseline to {path}")
+
+    if args.compare:
+        baseline = json.loads((BASELINE_DIR / f"{args.compare}.json").read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
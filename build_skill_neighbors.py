@@ -0,0 +1,64 @@
+"""Builds data/skill_neighbors.json, the precomputed skill-similarity table used for partial credit.
+
+    python build_skill_neighbors.py
+    python build_skill_neighbors.py --occupations data/synthetic/occupations.json --top-n 20
+
+Rerun after changing the occupation catalog, the taxonomy or data/skill_descriptions.json.
+"""
+import argparse
+import json
+import sys
+
+from core.hierarchy import SkillHierarchy
+from core.registry import HIERARCHY_FILE, OCCUPATIONS_FILE, TAXONOMY_FILE
+from core.similarity import DESCRIPTIONS_FILE, NEIGHBORS_FILE, build_neighbors
+
+# Sanity check on the output: pairs that must be neighbors, and name-only look-alikes that must not
+EXPECTED = [("PostgreSQL", "SQL"), ("PyTorch", "Deep Learning")]
+FORBIDDEN = [("Java", "JavaScript"), ("JavaScript", "Java"), ("A/B Testing", "API Testing")]
+
+def check(neighbors: dict) -> list[str]:
+    """Problems with the table, empty if it passes the sanity check."""
+    def has(skill, target):
+        return any(near == target for near, _ in neighbors.get(skill, ()))
+    return ([f"missing {a} -> {b}" for a, b in EXPECTED if not has(a, b)] +
+            [f"spurious {a} -> {b}" for a, b in FORBIDDEN if has(a, b)])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--occupations", default=OCCUPATIONS_FILE)
+    parser.add_argument("--descriptions", default=DESCRIPTIONS_FILE)
+    parser.add_argument("--taxonomy", default=TAXONOMY_FILE)
+    parser.add_argument("--hierarchy", default=HIERARCHY_FILE)
+    parser.add_argument("--out", default=NEIGHBORS_FILE)
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--min-sim", type=float, default=0.25)
+    args = parser.parse_args()
+
+    with open(args.occupations, "r", encoding="utf-8") as f:
+        occupations = json.load(f)
+    with open(args.descriptions, "r", encoding="utf-8") as f:
+        descriptions = json.load(f)
+    with open(args.taxonomy, "r", encoding="utf-8") as f:
+        taxonomy = json.load(f)
+    with open(args.hierarchy, "r", encoding="utf-8") as f:
+        hierarchy = SkillHierarchy.from_dict(json.load(f))
+
+    # Users may hold anything we have a name for, and roles may require any of it
+    skills = sorted({s["skill"] for o in occupations for s in o["skills_required"]}
+                    | set(descriptions) | set(taxonomy.values()))
+    # Hierarchy links (either direction) back up pairs whose descriptions say little
+    linked = set()
+    for skill in skills:
+        for other in hierarchy.expand([skill]) - {skill}:
+            linked |= {(skill, other), (other, skill)}
+    neighbors = build_neighbors(skills, skills, descriptions, top_n=args.top_n, min_sim=args.min_sim,
+                                linked=linked)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump({"top_n": args.top_n, "min_sim": args.min_sim, "neighbors": neighbors}, f, indent=1)
+    print(f"Wrote neighbors for {len(neighbors)} of {len(skills)} skills to {args.out}")
+    problems = check(neighbors)
+    for problem in problems:
+        print(f"Sanity check: {problem}", file=sys.stderr)
+    sys.exit(1 if problems else 0)
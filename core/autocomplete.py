@@ -0,0 +1,174 @@
+import bisect
+import numpy as np
+from rapidfuzz import fuzz, process
+
+class SkillCompleter:
+    """Prefix completion over canonical skills, their aliases and their words.
+
+    Search keys are kept in one sorted list, so a prefix is a contiguous slice found
+    with two bisects. Results are ranked by popularity (how many roles need the skill),
+    and answers for 1-2 character prefixes, whose slices are the largest, are
+    precomputed. If the prefix finds nothing, a fuzzy match is tried, but only over the
+    few names sharing the most of the query's rarest trigrams, so a typo costs about
+    as much at 100k skills as at 1k.
+    """
+
+    PRECOMPUTED_PREFIX_LEN = 2
+    FUZZY_CANDIDATES = 64    # names scored by rapidfuzz per fuzzy lookup
+    FUZZY_POSTINGS = 20_000  # trigram posting entries scanned per fuzzy lookup
+
+    def __init__(self, popularity: dict[str, float], aliases: dict[str, str] | None = None, n: int = 8):
+        self.n = n
+        self.names = sorted(popularity, key=lambda s: (-popularity[s], s.lower()))
+        name_ids = {s: i for i, s in enumerate(self.names)}
+        entries = set()
+        for skill, skill_id in name_ids.items():
+            # Every word start, so "learn" finds "Machine Learning"
+            words = skill.lower().replace("/", " ").replace("(", " ").split()
+            for start in range(len(words)):
+                entries.add((" ".join(words[start:]), skill_id))
+            entries.add((skill.lower(), skill_id))
+        for alias, skill in (aliases or {}).items():
+            if skill in name_ids:
+                entries.add((alias.lower(), name_ids[skill]))
+        entries = sorted(entries)
+        self.keys = [key for key, _ in entries]
+        # Ids are assigned in popularity order, so a smaller id means a more popular skill
+        self.ids = np.array([skill_id for _, skill_id in entries], dtype=np.int64)
+        self._lower_names = [s.lower() for s in self.names]
+        grams = {}
+        for skill_id, name in enumerate(self._lower_names):
+            for gram in _trigrams(name):
+                grams.setdefault(gram, []).append(skill_id)
+        # Posting lists are in id order, i.e. most popular first
+        self._grams = {gram: np.asarray(ids, dtype=np.int64) for gram, ids in grams.items()}
+        self._top = {}
+        for prefix in {key[:k] for key in self.keys for k in range(1, self.PRECOMPUTED_PREFIX_LEN + 1)}:
+            self._top[prefix] = self._by_prefix(prefix, n)
+
+    @classmethod
+    def from_catalog(cls, catalog) -> "SkillCompleter":
+        popularity = {}
+        for o in catalog.occupations:
+            for s in o.get("skills_required", []):
+                popularity[s['skill']] = popularity.get(s['skill'], 0) + 1
+        for skill in catalog.hierarchy.skills:
+            popularity.setdefault(skill, 0)
+        for skill in catalog.taxonomy.values():
+            popularity.setdefault(skill, 0)
+        return cls(popularity, dict(catalog.taxonomy))
+
+    def _by_prefix(self, prefix: str, n: int) -> list[str]:
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + "\uffff")
+        if lo == hi:
+            return []
+        ids = self.ids[lo:hi]
+        if len(ids) > 4 * n:
+            # The n best distinct ids are among the smallest few; skip sorting the whole slice
+            best = np.unique(np.partition(ids, 4 * n - 1)[:4 * n])
+            if len(best) >= n:
+                return [self.names[i] for i in best[:n]]
+        ids = np.unique(ids)  # sorted, so most popular first
+        return [self.names[i] for i in ids[:n]]
+
+    def complete(self, prefix: str, n: int | None = None) -> list[str]:
+        """Up to n canonical skills for what the user has typed so far."""
+        n = n or self.n
+        prefix = prefix.lower().strip()
+        if not prefix:
+            return []
+        if prefix in self._top and n <= self.n:
+            found = self._top[prefix][:n]
+        else:
+            found = self._by_prefix(prefix, n)
+        if not found and len(prefix) >= 3:
+            # Likely a typo; slower than a prefix lookup, so only when the prefix finds nothing
+            found = self._fuzzy(prefix, n)
+        return found
+
+    def _fuzzy(self, query: str, n: int) -> list[str]:
+        # Rarest trigrams first, since they say the most about which names are close
+        postings = sorted((self._grams[g] for g in _trigrams(query) if g in self._grams), key=len)
+        taken, budget = [], self.FUZZY_POSTINGS
+        for ids in postings:
+            if budget <= 0:
+                break
+            taken.append(ids[:budget])  # truncating keeps the most popular names
+            budget -= len(taken[-1])
+        if not taken:
+            return []
+        counts = np.bincount(np.concatenate(taken))
+        candidates = np.flatnonzero(counts)
+        if len(candidates) > self.FUZZY_CANDIDATES:
+            best = np.argpartition(-counts[candidates], self.FUZZY_CANDIDATES - 1)[:self.FUZZY_CANDIDATES]
+            candidates = np.sort(candidates[best])
+        choices = [self._lower_names[i] for i in candidates]
+        return [self.names[candidates[j]] for _, _, j in process.extract(
+            query, choices, scorer=fuzz.ratio, limit=n, score_cutoff=75)]
+
+def _trigrams(text: str) -> set[str]:
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _completer_for(catalog) -> SkillCompleter:
+    return SkillCompleter.from_catalog(catalog)
+
+def get_completer(catalog=None) -> SkillCompleter:
+    """Completer over the given (default: current) data snapshot, rebuilt only when the data is reloaded."""
+    from core.registry import derived, get_catalog
+    return derived(_completer_for, catalog or get_catalog())
+
+def skill_options(selected: list[str], search_key: str | None = None, catalog=None) -> list[str]:
+    """Multiselect options: the selection plus completions for what is in the search box.
+
+    Never the whole vocabulary, so the widget stays small however many skills the data knows.
+    """
+    query = search_query(search_key) if search_key else ""
+    completions = get_completer(catalog).complete(query) if query else []
+    return sorted(set(selected).union(completions), key=str.lower)
+
+def search_query(key: str) -> str:
+    """What is currently typed in skill_search(key)."""
+    import streamlit as st
+    return st.session_state.get(_box_key(key)) or ""
+
+def skill_search(key: str, catalog=None):
+    """Search-as-you-type box with ranked completions; clicking one adds it to the user's skills.
+
+    It is a fragment, so a keystroke reruns only the box and its completions; adding a
+    skill reruns the page. catalog is the rerun's snapshot (default: current).
+    """
+    import streamlit as st
+    st.fragment(_search_box)(key, catalog)
+
+def _search_box(key: str, catalog):
+    import streamlit as st
+    from st_keyup import st_keyup
+    if st.session_state.pop(f"{key}_added", False):
+        st.rerun()  # the skills widgets live outside this fragment
+    query = st_keyup("🔎 Find a skill", key=_box_key(key), debounce=150,
+                     placeholder="Type a few letters, e.g. kub or postgres")
+    if not query:
+        return
+    completions = get_completer(catalog).complete(query)
+    if not completions:
+        st.caption("No matching skills.")
+        return
+    cols = st.columns(2)
+    for i, skill in enumerate(completions):
+        cols[i % 2].button(f"➕ {skill}", key=f"{key}_{i}", use_container_width=True,
+                           on_click=_add_skill, args=(skill, key))
+
+def _box_key(key: str) -> str:
+    import streamlit as st
+    # A component's value can't be reset from Python, so clearing the box means a new key
+    return f"{key}_box{st.session_state.get(f'{key}_generation', 0)}"
+
+def _add_skill(skill: str, key: str):
+    import streamlit as st
+    skills = st.session_state.get("skills", [])
+    if skill not in skills:
+        st.session_state.skills = skills + [skill]
+    st.session_state[f"{key}_generation"] = st.session_state.get(f"{key}_generation", 0) + 1
+    st.session_state[f"{key}_added"] = True
@@ -0,0 +1,68 @@
+import hashlib, json, os, threading
+from collections import OrderedDict
+
+# A small bar chart's JSON is a few KB; per-role charts are the bulk of the entries
+FIGURE_CACHE_SIZE = int(os.getenv("FIGURE_CACHE_SIZE", "512"))
+
+class FigureCache:
+    """Process-wide LRU of Plotly figures, shared by every session.
+
+    Keys are a digest of the chart kind, the aggregated rows it is drawn from and its
+    options, so an unchanged chart is never rebuilt: no DataFrame, no plotly.express.
+    Entries hold the figure JSON and the Figure parsed from it once. st.plotly_chart
+    re-validates anything that isn't already a Figure (~15 ms for a small bar chart,
+    against <1 ms for a Figure), so callers get the shared Figure and must not modify it.
+    """
+
+    def __init__(self, maxsize: int = FIGURE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(kind: str, rows, options: dict) -> str:
+        payload = json.dumps([kind, rows, options], sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def get_or_build(self, kind: str, rows, build, **options):
+        """The cached figure for (kind, rows, options), calling build(rows, **options) on a miss."""
+        key = self.key(kind, rows, options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        import plotly.io as pio
+        spec = build(rows, **options).to_json()
+        figure = pio.from_json(spec)
+        with self._lock:
+            self._entries[key] = (spec, figure)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+figure_cache = FigureCache()
+
+def _build_bar(rows, x, y, title, **px_options):
+    import pandas as pd
+    import plotly.express as px
+    fig = px.bar(pd.DataFrame(rows), x=x, y=y, orientation="h", title=title, **px_options)
+    fig.update_layout(yaxis={"categoryorder": "total ascending"})
+    return fig
+
+def bar_chart(rows: list[dict], x: str, y: str, title: str, **px_options):
+    """Horizontal bar chart of rows ([{column: value}]), largest bar on top, from the figure cache."""
+    return figure_cache.get_or_build("bar", rows, _build_bar, x=x, y=y, title=title, **px_options)
@@ -0,0 +1,108 @@
+import logging, os, threading
+from core import llm
+from core.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+# Recent exchanges (user + model) sent verbatim; older ones only survive in the summary
+MAX_TURNS = int(os.getenv("COACH_MAX_TURNS", "6"))
+CONTEXT_TOKEN_BUDGET = int(os.getenv("COACH_CONTEXT_TOKENS", "3000"))
+# Evicted exchanges kept for the summary while summarizing keeps failing; older ones are dropped
+MAX_PENDING_TURNS = int(os.getenv("COACH_MAX_PENDING_TURNS", "20"))
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English; count_tokens would cost a round trip per message
+    return len(text) // 4 + 1
+
+class CoachContext:
+    """Bounded model context for one coach conversation.
+
+    The coach prompt goes in the model's system instruction, so setup costs no request.
+    Each message sends the rolling summary plus the last MAX_TURNS exchanges, trimmed
+    further to CONTEXT_TOKEN_BUDGET, so a request's size doesn't grow with the
+    conversation. Exchanges that fall out of the window are folded into the summary by
+    a background thread; a message never waits for it, and until it finishes the
+    previous summary is used. If summarizing keeps failing, only the newest
+    MAX_PENDING_TURNS evicted exchanges wait for the next try.
+    """
+
+    def __init__(self, system_instruction: str, model=None, max_turns: int = MAX_TURNS,
+                 token_budget: int = CONTEXT_TOKEN_BUDGET, summarize=None):
+        self.model = model or llm.get_chat_model(system_instruction)
+        self.max_turns = max_turns
+        self.token_budget = token_budget
+        self.summary = ""
+        self.turns = []     # [{"role", "text"}], oldest first, always in user/model pairs
+        self._pending = []  # evicted turns not yet in the summary
+        self._summarize = summarize or llm.summarize_conversation
+        self._summarizing = False
+        self._lock = threading.Lock()
+
+    def contents(self, prompt: str) -> list[dict]:
+        """What one request sends: summary, recent turns and the new message."""
+        with self._lock:
+            contents = []
+            if self.summary:
+                contents.append({"role": "user", "parts": [f"Summary of our conversation so far: {self.summary}"]})
+                contents.append({"role": "model", "parts": ["Got it, I'll keep that in mind."]})
+            contents += [{"role": t["role"], "parts": [t["text"]]} for t in self.turns]
+        contents.append({"role": "user", "parts": [prompt]})
+        return contents
+
+    @timed("coach.send")
+    def send(self, prompt: str) -> str:
+        response = self.model.generate_content(self.contents(prompt))
+        reply = (response.text or "").strip()
+        with self._lock:
+            self.turns += [{"role": "user", "text": prompt}, {"role": "model", "text": reply}]
+            self._evict()
+            start = bool(self._pending) and not self._summarizing
+            if start:
+                self._summarizing = True
+        if start:
+            threading.Thread(target=self._fold, name="coach-summary", daemon=True).start()
+        return reply
+
+    def restore(self, exchanges: list[tuple[str, str]]):
+        """Seeds the context from a stored conversation; older exchanges are summarized in the background."""
+        with self._lock:
+            for prompt, reply in exchanges:
+                self.turns += [{"role": "user", "text": prompt}, {"role": "model", "text": reply}]
+            self._evict()
+            start = bool(self._pending) and not self._summarizing
+            if start:
+                self._summarizing = True
+        if start:
+            threading.Thread(target=self._fold, name="coach-summary", daemon=True).start()
+
+    def _evict(self):
+        tokens = sum(estimate_tokens(t["text"]) for t in self.turns)
+        # Always keep the latest exchange, even if it alone is over budget
+        while len(self.turns) > 2 and (len(self.turns) > 2 * self.max_turns or tokens > self.token_budget):
+            evicted, self.turns = self.turns[:2], self.turns[2:]
+            tokens -= sum(estimate_tokens(t["text"]) for t in evicted)
+            self._pending += evicted
+        if len(self._pending) > 2 * MAX_PENDING_TURNS:
+            del self._pending[:len(self._pending) - 2 * MAX_PENDING_TURNS]
+
+    def _fold(self):
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+                summary = self.summary
+                if not pending:
+                    self._summarizing = False
+                    return
+            try:
+                summary = self._summarize(summary, pending)
+            except Exception:
+                # Keep the turns pending; the next eviction retries
+                logger.exception("Summarizing the coach conversation failed")
+                with self._lock:
+                    self._summarizing = False
+                return
+            with self._lock:
+                self.summary = summary
+                # _evict may have dropped some of these meanwhile, so remove by identity
+                folded = set(map(id, pending))
+                self._pending = [t for t in self._pending if id(t) not in folded]
@@ -0,0 +1,83 @@
+import threading
+import numpy as np
+from scipy import sparse
+
+class SkillGraph:
+    """Weighted skill co-occurrence graph stored as a sparse adjacency matrix.
+
+    Edge weight is the summed product of the two skills' (0..1 scaled) weights over
+    every document they share, i.e. occupations and, later, ingested job postings.
+    """
+
+    def __init__(self):
+        self.skill_ids = {}
+        self.skills = []
+        self.adjacency = sparse.csr_matrix((0, 0))
+        self._normalized = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_occupations(cls, occupations: list[dict]) -> "SkillGraph":
+        graph = cls()
+        graph.add_documents([
+            {s['skill']: s['weight'] / 5 for s in o.get("skills_required", [])} for o in occupations
+        ])
+        return graph
+
+    def add_documents(self, documents: list):
+        """Folds in documents given as {skill: weight} dicts or plain skill lists (weight 1)."""
+        rows, cols, vals = [], [], []
+        with self._lock:
+            for doc_idx, doc in enumerate(documents):
+                weights = doc if isinstance(doc, dict) else {s: 1.0 for s in doc}
+                for skill, weight in weights.items():
+                    if skill not in self.skill_ids:
+                        self.skill_ids[skill] = len(self.skills)
+                        self.skills.append(skill)
+                    rows.append(doc_idx)
+                    cols.append(self.skill_ids[skill])
+                    vals.append(weight)
+            n = len(self.skills)
+            docs = sparse.csr_matrix((vals, (rows, cols)), shape=(len(documents), n))
+            adjacency = self.adjacency.copy()
+            adjacency.resize((n, n))
+            # Swap in a new matrix rather than mutating, so concurrent readers see a consistent graph
+            self.adjacency = (adjacency + docs.T @ docs).tocsr()
+            self._normalized = None
+
+    @property
+    def normalized(self) -> sparse.csr_matrix:
+        """Cosine-normalized adjacency without self loops, so ubiquitous skills don't dominate."""
+        normalized = self._normalized
+        if normalized is None:
+            adjacency = self.adjacency
+            strength = np.sqrt(np.maximum(adjacency.diagonal(), 1e-12))
+            scale = sparse.diags(1 / strength)
+            normalized = (scale @ adjacency @ scale).tolil()
+            normalized.setdiag(0)
+            normalized = normalized.tocsr()
+            normalized.eliminate_zeros()
+            self._normalized = normalized
+        return normalized
+
+    def complementary(self, user_skills: list[str], n: int = 5) -> list[tuple[str, float]]:
+        """Skills that co-occur most strongly with the user's set, excluding ones they have."""
+        ids = [self.skill_ids[s] for s in set(user_skills) if s in self.skill_ids]
+        if not ids:
+            return []
+        normalized = self.normalized
+        scores = np.asarray(normalized[ids].sum(axis=0)).ravel() / len(ids)
+        scores[ids] = 0
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > n:
+            candidates = candidates[np.argpartition(-scores[candidates], n)[:n]]
+        order = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [(self.skills[i], round(float(scores[i]), 3)) for i in order]
+
+def _graph_for(catalog) -> SkillGraph:
+    return SkillGraph.from_occupations(catalog.occupations)
+
+def get_skill_graph(catalog=None) -> SkillGraph:
+    """Co-occurrence graph over the given (default: current) snapshot's occupations, rebuilt only when the data is reloaded."""
+    from core.registry import derived, get_catalog
+    return derived(_graph_for, catalog or get_catalog())
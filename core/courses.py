@@ -1,4 +1,7 @@
+import csv, functools, json, pathlib, re
 from urllib.parse import quote_plus
+import numpy as np
+from scipy import sparse
 
 def google_course_search(term: str) -> str:
     return f"https://www.google.com/search?q={quote_plus(term + ' course beginner')}"
@@ -16,3 +19,156 @@ def links_for_gap(gap: str) -> dict:
         "edX": edx_search(gap),
         "YouTube": f"https://www.youtube.com/results?search_query={quote_plus(gap+' tutorial')}"
     }
+
+COURSES_FILE = str(pathlib.Path(__file__).resolve().parent.parent / "data" / "courses.json")
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+# Words that say nothing about a skill; matching only on them finds unrelated courses
+STOPWORDS = frozenset("""
+a an and are as at be by for from how in into is it of on or the to with without your you
+written verbal basic basics advanced intro introduction beginner beginners course courses learn learning
+""".split())
+
+def _tokens(text: str) -> list[str]:
+    # Single letters are dropped too; one-letter skills like "R" still match through their tag
+    return [tok for tok in _TOKEN.findall(text.lower()) if len(tok) > 1 and tok not in STOPWORDS]
+
+def load_courses(path: str = COURSES_FILE) -> list[dict]:
+    """Course dump as JSON (list of objects) or CSV (skills separated by ';'). Empty if missing."""
+    p = pathlib.Path(path)
+    if not p.exists():
+        return []
+    if p.suffix.lower() == ".csv":
+        with open(p, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            row["skills"] = [s.strip() for s in row.get("skills", "").split(";") if s.strip()]
+            row["hours"] = float(row.get("hours") or 0)
+            row["cost"] = float(row.get("cost") or 0)
+        return rows
+    return json.loads(p.read_text(encoding="utf-8"))
+
+class CourseIndex:
+    """BM25 over course titles, descriptions and skill tags, scored for many gaps at once.
+
+    Documents are a precomputed course x term BM25 weight matrix, so ranking every
+    gap on a page is one sparse product (gaps x terms) @ (terms x courses).
+    Courses tagged with the exact gap skill get a bonus on top of the text match.
+    Any other course must cover most of the gap's words (weighted by idf) in its title
+    and tags, so one shared generic word like "Testing" or "Design" is not a hit.
+    """
+
+    K1, B, TAG_BONUS = 1.2, 0.75, 2.0
+    # Share of the gap's idf that a course's title and tag words must cover
+    MIN_COVERAGE = 0.8
+
+    def __init__(self, courses: list[dict]):
+        self.courses = courses
+        self.terms = {}
+        rows, cols, tfs = [], [], []
+        lengths = []
+        for doc_idx, c in enumerate(courses):
+            # Title and tags repeated so they outweigh incidental description words
+            text = " ".join([c.get("title", "")] * 2 + list(c.get("skills", [])) * 2 + [c.get("description", "")])
+            counts = {}
+            for tok in _tokens(text):
+                counts[tok] = counts.get(tok, 0) + 1
+            lengths.append(sum(counts.values()))
+            for tok, tf in counts.items():
+                rows.append(doc_idx)
+                cols.append(self.terms.setdefault(tok, len(self.terms)))
+                tfs.append(tf)
+        n_docs, n_terms = len(courses), len(self.terms)
+        tfs = np.asarray(tfs, dtype=np.float64)
+        lengths = np.asarray(lengths, dtype=np.float64)
+        df = np.bincount(np.asarray(cols, dtype=np.int64), minlength=n_terms)
+        idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        self.idf = idf
+        # A gap word no course mentions weighs more than any known word
+        self.unknown_idf = np.log(1 + (n_docs + 0.5) / 0.5)
+        avg_length = lengths.mean() if n_docs else 1.0
+        norm = self.K1 * (1 - self.B + self.B * lengths / avg_length)
+        weights = idf[cols] * tfs * (self.K1 + 1) / (tfs + norm[rows])
+        self.weights_t = sparse.csr_matrix((weights, (cols, rows)), shape=(n_terms, n_docs))
+        self.tags = {}
+        key_rows, key_cols = [], []
+        for doc_idx, c in enumerate(courses):
+            for skill in c.get("skills", []):
+                self.tags.setdefault(skill.lower(), []).append(doc_idx)
+            for tok in set(_tokens(" ".join([c.get("title", ""), *c.get("skills", [])]))):
+                key_rows.append(self.terms[tok])
+                key_cols.append(doc_idx)
+        # term x course: the term's idf where it is in the course's title or tags
+        self.key_idf_t = sparse.csr_matrix((idf[key_rows], (key_rows, key_cols)), shape=(n_terms, n_docs))
+        self.hours = np.array([float(c.get("hours") or 0) for c in courses])
+        self.cost = np.array([float(c.get("cost") or 0) for c in courses])
+
+    def search_many(self, gaps: list[str], n: int = 3, max_hours: float | None = None,
+                    max_cost: float | None = None) -> dict:
+        """{gap: up to n courses (with a "score")} for every gap, in one batched query."""
+        if not gaps or not self.courses:
+            return {gap: [] for gap in gaps}
+        rows, cols = [], []
+        gap_idf = np.zeros(len(gaps))
+        for i, gap in enumerate(gaps):
+            for tok in set(_tokens(gap)):
+                if tok in self.terms:
+                    rows.append(i)
+                    cols.append(self.terms[tok])
+                    gap_idf[i] += self.idf[self.terms[tok]]
+                else:
+                    gap_idf[i] += self.unknown_idf
+            # Letters _tokens drops still count as uncovered, so "A/B Testing" isn't just "testing"
+            gap_idf[i] += self.unknown_idf * len({tok for tok in _TOKEN.findall(gap.lower())
+                                                  if len(tok) == 1 and tok not in STOPWORDS})
+        queries = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(gaps), len(self.terms)))
+        scores = (queries @ self.weights_t).toarray()
+        # idf of the gap's words found in each course's title and tags
+        covered = (queries @ self.key_idf_t).toarray()
+        hit = covered >= self.MIN_COVERAGE * gap_idf[:, None]
+        for i, gap in enumerate(gaps):
+            tagged = self.tags.get(gap.lower(), [])
+            scores[i, tagged] += self.TAG_BONUS
+            hit[i, tagged] = True
+        scores[~hit] = 0
+        allowed = np.ones(len(self.courses), dtype=bool)
+        if max_hours is not None:
+            allowed &= self.hours <= max_hours
+        if max_cost is not None:
+            allowed &= self.cost <= max_cost
+        scores[:, ~allowed] = 0
+        results = {}
+        for i, gap in enumerate(gaps):
+            order = np.argsort(-scores[i], kind="stable")[:n]
+            results[gap] = [{**self.courses[j], "score": round(float(scores[i, j]), 3)}
+                            for j in order if scores[i, j] > 0]
+        return results
+
+@functools.lru_cache(maxsize=1)
+def get_course_index() -> CourseIndex:
+    """Index over data/courses.json, built once per process."""
+    return CourseIndex(load_courses())
+
+# Sanity check for data/courses.json and the hit rules: python -m core.courses
+EXPECTED = [("Python", "Learn Python"), ("Database Design", "PostgreSQL Tutorial"),
+            ("Data Structures", "CS50's Introduction to Computer Science"), ("A/B Testing", "Statistics and Probability")]
+# Gaps that share one generic word with a course title or tag, and nothing else
+FORBIDDEN = [("Communication (written and verbal)", None), ("Unit Testing", None), ("User Testing", None),
+             ("Performance Testing", None), ("Test Case Design", None), ("Marketing Automation", None),
+             ("Budget Management", None), ("Data Structures", "Data Cleaning"), ("A/B Testing", "Selenium Documentation")]
+
+def check(index: CourseIndex) -> list[str]:
+    """Problems with the index, empty if it passes. A FORBIDDEN course of None means the gap must find nothing."""
+    results = index.search_many([gap for gap, _ in EXPECTED + FORBIDDEN])
+    def titles(gap):
+        return [c["title"] for c in results[gap]]
+    return ([f"missing {gap} -> {title}" for gap, title in EXPECTED if title not in titles(gap)] +
+            [f"spurious {gap} -> {', '.join(titles(gap))}" for gap, title in FORBIDDEN
+             if (title is None and titles(gap)) or (title is not None and title in titles(gap))])
+
+if __name__ == "__main__":
+    problems = check(get_course_index())
+    for problem in problems:
+        print(problem)
+    raise SystemExit(1 if problems else 0)
@@ -0,0 +1,75 @@
+import numpy as np
+from scipy import sparse
+
+class SkillHierarchy:
+    """Parent and implies edges between skills, with the transitive closure precomputed.
+
+    `closure` is a boolean skill x skill CSR matrix where row i marks every skill that
+    skill i implies (itself included), directly or through any chain of edges. Expanding
+    a user's skills is then an OR over a few rows instead of a graph walk.
+    """
+
+    def __init__(self, edges: dict[str, list[str]]):
+        self.skill_ids = {}
+        self.skills = []
+        rows, cols = [], []
+        for skill, implied in edges.items():
+            for other in implied:
+                rows.append(self._id(skill))
+                cols.append(self._id(other))
+        n = len(self.skills)
+        reach = sparse.csr_matrix((np.ones(len(rows), dtype=bool), (rows, cols)), shape=(n, n))
+        reach = (reach + sparse.identity(n, dtype=bool, format="csr")).astype(bool)
+        # Repeated squaring doubles the path length covered each round, so depth d needs log2(d) products
+        while True:
+            longer = (reach @ reach).astype(bool).tocsr()
+            if longer.nnz == reach.nnz:
+                break
+            reach = longer
+        self.closure = reach
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SkillHierarchy":
+        """From {"parents": {child: parent}, "implies": {skill: [skills]}}."""
+        edges = {}
+        for child, parent in data.get("parents", {}).items():
+            edges.setdefault(child, []).append(parent)
+        for skill, implied in data.get("implies", {}).items():
+            edges.setdefault(skill, []).extend(implied)
+        return cls(edges)
+
+    def _id(self, skill: str) -> int:
+        skill_id = self.skill_ids.get(skill)
+        if skill_id is None:
+            skill_id = self.skill_ids[skill] = len(self.skills)
+            self.skills.append(skill)
+        return skill_id
+
+    def implied(self, user_skills) -> dict:
+        """{implied skill the user didn't list: one of their skills it follows from}."""
+        user_set = set(user_skills)
+        implied = {}
+        for skill in sorted(user_set):
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is None:
+                continue
+            row = self.closure.indices[self.closure.indptr[skill_id]:self.closure.indptr[skill_id + 1]]
+            for other in row:
+                name = self.skills[other]
+                if name not in user_set:
+                    implied.setdefault(name, skill)
+        return implied
+
+    def expand(self, user_skills) -> set:
+        """The user's skills plus everything they imply."""
+        user_set = set(user_skills)
+        ids = [self.skill_ids[s] for s in user_set if s in self.skill_ids]
+        if not ids:
+            return user_set
+        reached = np.unique(self.closure[ids].indices)
+        return user_set | {self.skills[i] for i in reached}
+
+def get_hierarchy() -> SkillHierarchy:
+    """The hierarchy from data/skills_hierarchy.json in the current data snapshot (see core.registry)."""
+    from core.registry import get_catalog
+    return get_catalog().hierarchy
@@ -0,0 +1,296 @@
+import bisect, heapq, uuid
+from types import MappingProxyType
+import numpy as np
+from scipy import sparse
+
+# Upper bound on users x occupations score cells per chunk, which caps the sparse product's size
+MAX_CHUNK_CELLS = 1 << 24
+
+class OccupationIndex:
+    """Compiled form of the occupation catalog for fast, repeated ranking.
+
+    Skills are mapped to integer ids and each skill keeps a posting list of
+    (occupation, weight) pairs, so scoring a user only touches occupations
+    that share at least one of their skills.
+    """
+
+    def __init__(self, occupations: list[dict], version: str | None = None):
+        self.occupations = occupations
+        # Identifies the dataset for caches keyed across indexes (see core.memo)
+        self.version = version or uuid.uuid4().hex
+        self.skill_ids = {}
+        self.skills = []
+        self.postings = []
+        self.totals = []
+        for occ_idx, o in enumerate(occupations):
+            req = o.get("skills_required", [])
+            self.totals.append(max(1, sum(s['weight'] for s in req)))
+            for s in req:
+                skill_id = self.skill_id(s['skill'], create=True)
+                self.postings[skill_id].append((occ_idx, s['weight']))
+
+        self.occ_ids = {o.get("occupation"): i for i, o in enumerate(occupations)}
+        self._weights_t = None
+        self._role_neighbors = None
+        self._top_weights = {}
+
+    @property
+    def weights_t(self) -> sparse.csr_matrix:
+        """Skill x occupation weight matrix (CSR), built on first use."""
+        if self._weights_t is None:
+            rows, cols, vals = [], [], []
+            for skill_id, posting in enumerate(self.postings):
+                for occ_idx, weight in posting:
+                    rows.append(skill_id)
+                    cols.append(occ_idx)
+                    vals.append(weight)
+            weights_t = sparse.csr_matrix(
+                (np.array(vals, dtype=np.float64), (rows, cols)),
+                shape=(len(self.skills), len(self.occupations)))
+            for array in (weights_t.data, weights_t.indices, weights_t.indptr):
+                array.flags.writeable = False
+            self._weights_t = weights_t
+        return self._weights_t
+
+    def freeze(self) -> "OccupationIndex":
+        """Makes the lookup tables read-only so one index can be shared by every session."""
+        self.skill_ids = MappingProxyType(self.skill_ids)
+        self.occ_ids = MappingProxyType(self.occ_ids)
+        self.skills = tuple(self.skills)
+        self.postings = tuple(tuple(p) for p in self.postings)
+        self.totals = tuple(self.totals)
+        return self
+
+    def skill_id(self, skill: str, create: bool = False):
+        skill_id = self.skill_ids.get(skill)
+        if skill_id is None and create:
+            skill_id = self.skill_ids[skill] = len(self.skills)
+            self.skills.append(skill)
+            self.postings.append([])
+        return skill_id
+
+    def raw_scores(self, user_skills, partial_credit: dict | None = None) -> list[float]:
+        """Matched weight per occupation (before dividing by the occupation's total)."""
+        raw = [0] * len(self.occupations)
+        user_set = set(user_skills)
+        credits = [(skill, 1) for skill in user_set]
+        if partial_credit:
+            credits += [(skill, c) for skill, c in partial_credit.items() if skill not in user_set]
+        for skill, credit in credits:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is None:
+                continue
+            for occ_idx, weight in self.postings[skill_id]:
+                raw[occ_idx] += weight * credit
+        return raw
+
+    def rank(self, user_skills: list[str], top_k: int = 5, partial_credit: dict | None = None) -> list[dict]:
+        """Same output as scoring.rank_roles, but gaps are only built for the returned roles."""
+        raw = self.raw_scores(user_skills, partial_credit)
+        scores = [round(r / t, 3) for r, t in zip(raw, self.totals)]
+        # Ties keep catalog order, matching the stable sort in rank_roles
+        order = heapq.nsmallest(top_k, range(len(scores)), key=lambda i: (-scores[i], i))
+        return [self.result(i, scores[i], set(user_skills)) for i in order]
+
+    def result(self, occ_idx: int, score: float, user_set: set) -> dict:
+        o = self.occupations[occ_idx]
+        gaps = [s['skill'] for s in o.get("skills_required", []) if s['skill'] not in user_set]
+        return {**o, "score": score, "gaps": gaps}
+
+    def user_matrix(self, users: list[list[str]]) -> sparse.csr_matrix:
+        """Binary user x skill matrix; skills outside the catalog are dropped."""
+        indptr, indices = [0], []
+        for skills in users:
+            ids = {self.skill_ids[s] for s in skills if s in self.skill_ids}
+            indices.extend(sorted(ids))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float64)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(users), len(self.skills)))
+
+    def rank_many(self, users: list[list[str]], top_k: int = 5, chunk_size: int = 4096) -> list[list[dict]]:
+        """rank() for many users at once: one sparse product per chunk of users."""
+        n_occ = len(self.occupations)
+        top_k = min(top_k, n_occ)
+        if not users or top_k == 0:
+            return [[] for _ in users]
+        totals = np.asarray(self.totals, dtype=np.float64)
+        chunk_size = max(1, min(chunk_size, MAX_CHUNK_CELLS // max(1, n_occ)))
+        results = []
+        for start in range(0, len(users), chunk_size):
+            chunk = users[start:start + chunk_size]
+            # Stays sparse: only occupations sharing a skill with the user get a score
+            product = (self.user_matrix(chunk) @ self.weights_t).tocsr()
+            scores = _round3(product.data / totals[product.indices])
+            for row, skills in enumerate(chunk):
+                lo, hi = product.indptr[row], product.indptr[row + 1]
+                order = _top_k_stable(product.indices[lo:hi], scores[lo:hi], top_k, n_occ)
+                user_set = set(skills)
+                results.append([self.result(i, score, user_set) for i, score in order])
+        return results
+
+    def role_neighbors(self, top_n: int = 10) -> list[list[tuple[int, float]]]:
+        """Top-n most similar occupations for each occupation (weighted cosine over skill weights).
+
+        Computed once per index in row chunks, so only the sparse top-n lists are kept.
+        """
+        if self._role_neighbors is None:
+            by_role = self.weights_t.T.tocsr()
+            norms = np.sqrt(by_role.multiply(by_role).sum(axis=1)).A1
+            by_role = sparse.diags(1 / np.maximum(norms, 1e-12)) @ by_role
+            by_role_t = by_role.T.tocsr()
+            neighbors = []
+            for start in range(0, by_role.shape[0], 1024):
+                sims = (by_role[start:start + 1024] @ by_role_t).tocsr()
+                for row in range(sims.shape[0]):
+                    lo, hi = sims.indptr[row], sims.indptr[row + 1]
+                    cols, vals = sims.indices[lo:hi], sims.data[lo:hi]
+                    keep = cols != start + row
+                    if len(vals) > top_n + 1:
+                        keep &= vals >= np.partition(vals, len(vals) - top_n - 1)[len(vals) - top_n - 1]
+                    cols, vals = cols[keep], vals[keep]
+                    order = np.lexsort((cols, -vals))[:top_n]
+                    neighbors.append([(int(cols[i]), round(float(vals[i]), 3)) for i in order])
+            self._role_neighbors = neighbors
+        return self._role_neighbors
+
+    def similar_roles(self, occupations: list[str], n: int = 5) -> list[tuple[str, float]]:
+        """Roles most similar to the given ones (summed similarity), excluding the given roles."""
+        given = {self.occ_ids[o] for o in occupations if o in self.occ_ids}
+        neighbors = self.role_neighbors()
+        totals = {}
+        for occ_idx in given:
+            for other, sim in neighbors[occ_idx]:
+                if other not in given:
+                    totals[other] = totals.get(other, 0) + sim
+        best = heapq.nsmallest(n, totals.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [(self.occupations[i]["occupation"], round(sim / max(1, len(given)), 3)) for i, sim in best]
+
+    def _top_weight_sums(self, n: int) -> np.ndarray:
+        """Per occupation, the summed weight of its n heaviest skills (cached per n)."""
+        if n not in self._top_weights:
+            self._top_weights[n] = np.array([
+                sum(sorted((s['weight'] for s in o.get("skills_required", [])), reverse=True)[:n])
+                for o in self.occupations
+            ], dtype=np.float64)
+        return self._top_weights[n]
+
+    def reachable_roles(self, user_skills: list[str], max_new: int = 2, target: float = 0.5,
+                        n: int = 5) -> list[dict]:
+        """Roles below `target` that reach it by learning at most `max_new` of their heaviest gaps."""
+        user_set = set(user_skills)
+        raw = np.asarray(self.raw_scores(user_skills), dtype=np.float64)
+        totals = np.asarray(self.totals, dtype=np.float64)
+        # Cheap vectorized upper bound first: the heaviest max_new skills of each role
+        best_gain = self._top_weight_sums(max_new)
+        current = raw / totals
+        candidates = np.flatnonzero((current < target) & ((raw + best_gain) / totals >= target))
+        reachable = []
+        for occ_idx in candidates:
+            o = self.occupations[occ_idx]
+            gaps = sorted((s for s in o.get("skills_required", []) if s['skill'] not in user_set),
+                          key=lambda s: -s['weight'])
+            learn = []
+            gain = 0
+            for s in gaps[:max_new]:
+                learn.append(s['skill'])
+                gain += s['weight']
+                if (raw[occ_idx] + gain) / totals[occ_idx] >= target:
+                    reachable.append({
+                        "occupation": o["occupation"],
+                        "score": round(float(current[occ_idx]), 3),
+                        "new_score": round(float((raw[occ_idx] + gain) / totals[occ_idx]), 3),
+                        "learn": learn,
+                    })
+                    break
+        reachable.sort(key=lambda r: (len(r["learn"]), -r["new_score"]))
+        return reachable[:n]
+
+class IncrementalScorer:
+    """Per-session ranking state that applies skill edits as deltas.
+
+    Adding or removing a skill (or changing its partial credit) rescores only the
+    occupations in that skill's posting list, and the ranking is kept as a sorted
+    list of (-score, occupation) keys updated with bisect. Scores match rank_roles.
+    """
+
+    def __init__(self, index: OccupationIndex, user_skills=(), partial_credit: dict | None = None):
+        self.index = index
+        self.user_set = set()
+        self.credit = {}
+        self.scores = [0.0] * len(index.occupations)
+        self.order = [(-0.0, i) for i in range(len(index.occupations))]
+        self.update(user_skills, partial_credit)
+
+    def update(self, user_skills, partial_credit: dict | None = None):
+        """Moves to a new skill set / credit map, touching only what changed."""
+        user_set = set(user_skills)
+        credit = dict(partial_credit or {})
+        changed = (user_set ^ self.user_set) | {
+            s for s in credit.keys() | self.credit.keys() if credit.get(s) != self.credit.get(s)}
+        self.user_set, self.credit = user_set, credit
+        affected = set()
+        for skill in changed:
+            skill_id = self.index.skill_ids.get(skill)
+            if skill_id is not None:
+                affected.update(occ_idx for occ_idx, _ in self.index.postings[skill_id])
+        for occ_idx in affected:
+            self._rescore(occ_idx)
+
+    def add(self, skill: str):
+        self.update(self.user_set | {skill}, self.credit)
+
+    def remove(self, skill: str):
+        self.update(self.user_set - {skill}, self.credit)
+
+    def _rescore(self, occ_idx: int):
+        # Same arithmetic, in the same order, as rank_roles so rounding agrees exactly
+        req = self.index.occupations[occ_idx].get("skills_required", [])
+        user_score = sum(s['weight'] for s in req if s['skill'] in self.user_set)
+        if self.credit:
+            user_score += sum(s['weight'] * self.credit.get(s['skill'], 0)
+                              for s in req if s['skill'] not in self.user_set)
+        score = round(user_score / self.index.totals[occ_idx], 3)
+        old = self.scores[occ_idx]
+        if score == old:
+            return
+        del self.order[bisect.bisect_left(self.order, (-old, occ_idx))]
+        bisect.insort(self.order, (-score, occ_idx))
+        self.scores[occ_idx] = score
+
+    def top(self, k: int, min_score: float = 0.0) -> list[dict]:
+        """Top k results at or above min_score, in rank_roles order."""
+        results = []
+        for neg_score, occ_idx in self.order[:k]:
+            if -neg_score < min_score:
+                break
+            results.append(self.index.result(occ_idx, -neg_score, self.user_set))
+        return results
+
+    def count_above(self, score: float = 0.0) -> int:
+        """Number of occupations scoring strictly above `score`."""
+        return bisect.bisect_left(self.order, (-score, -1))
+
+def _round3(ratios: np.ndarray) -> np.ndarray:
+    """np.round(x, 3), corrected to Python's round() where they can disagree (near .0005 ties)."""
+    scores = np.round(ratios, 3)
+    scaled = ratios * 1000
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        scores[near_half] = [round(float(x), 3) for x in ratios[near_half]]
+    return scores
+
+def _top_k_stable(cols: np.ndarray, scores: np.ndarray, k: int, n_occ: int) -> list[tuple[int, float]]:
+    """Top k (occupation, score) pairs from one sparse row; ties keep catalog order like a stable sort."""
+    keep = scores > 0
+    if len(scores) > k:
+        # Only the k-th best score and above can make the cut; sort just those
+        keep &= scores >= np.partition(scores, len(scores) - k)[len(scores) - k]
+    cols, scores = cols[keep], scores[keep]
+    order = np.lexsort((cols, -scores))[:k]
+    top = [(int(cols[i]), float(scores[i])) for i in order]
+    if len(top) < k:
+        # Remaining slots go to zero-score occupations, in catalog order
+        scored = set(cols.tolist())
+        zeros = (i for i in range(n_occ) if i not in scored)
+        top.extend((i, 0.0) for _, i in zip(range(k - len(top)), zeros))
+    return top
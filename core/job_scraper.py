@@ -1,10 +1,8 @@
-import requests
 import streamlit as st
-import pandas as pd
 from urllib.parse import quote_plus
-import time
 import random
-import json
+from core.salary import salary_stats, parse_salary_range
+from core.metrics import timed
 
 class JobScraper:
     def __init__(self):
@@ -27,32 +25,41 @@ class JobScraper:
             'careerbuilder': 'https://www.careerbuilder.com/jobs'
         }
     
-    def get_professional_job_recommendations(self, role: str, skills: list = None, location: str = "", max_results: int = 15) -> list:
+    @timed("jobs.get_professional_job_recommendations")
+    def get_professional_job_recommendations(self, role: str, skills: list = None, location: str = "", max_results: int = 15, occupation: str | None = None) -> list:
         """Get professional job recommendations using multiple strategies"""
         
         # Show loading message
         with st.spinner("🔍 Searching for the best job opportunities..."):
-            
-            # Strategy 1: Generate realistic job postings based on role and skills
-            realistic_jobs = self._generate_realistic_jobs(role, skills, location, max_results)
-            
-            # Strategy 2: Try to get some real data from less protected sources
-            real_jobs = self._try_real_job_search(role, skills, location, max_results//2)
-            
-            # Combine and deduplicate
-            all_jobs = realistic_jobs + real_jobs
-            
-            # Remove duplicates
-            seen = set()
-            unique_jobs = []
-            for job in all_jobs:
-                key = (job['title'], job['company'])
-                if key not in seen:
-                    seen.add(key)
-                    unique_jobs.append(job)
-            
-            return unique_jobs[:max_results]
+            return self.recommend_jobs(role, skills, location, max_results, occupation)
     
+    def recommend_jobs(self, role: str, skills: list = None, location: str = "", max_results: int = 15, occupation: str | None = None) -> list:
+        """UI-free job recommendations, shared by the Streamlit pages and the HTTP API"""
+        
+        # Strategy 1: Generate realistic job postings based on role and skills
+        realistic_jobs = self._generate_realistic_jobs(role, skills, location, max_results)
+        
+        # Strategy 2: Try to get some real data from less protected sources
+        real_jobs = self._try_real_job_search(role, skills, location, max_results//2)
+        
+        # Combine and deduplicate
+        all_jobs = realistic_jobs + real_jobs
+        
+        # Remove duplicates
+        seen = set()
+        unique_jobs = []
+        for job in all_jobs:
+            key = (job['title'], job['company'])
+            if key not in seen:
+                seen.add(key)
+                unique_jobs.append(job)
+        
+        # Feed the shared salary sketches, keyed by occupation when the caller knows it
+        salary_stats.ingest(unique_jobs, occupation or role)
+        
+        return unique_jobs[:max_results]
+    
+    @timed("jobs.generate_realistic_jobs")
     def _generate_realistic_jobs(self, role: str, skills: list = None, location: str = "", max_results: int = 10) -> list:
         """Generate realistic job postings based on role and skills"""
         
@@ -230,7 +237,7 @@ class JobScraper:
         
         return jobs
     
-    def display_jobs(self, jobs: list, title: str = "Job Search Results", widget_key: str | None = None):
+    def display_jobs(self, jobs: list, title: str = "Job Search Results", widget_key: str | None = None, stats_key: str | None = None):
         """Display jobs in a professional format using Streamlit"""
         if not jobs:
             st.warning("No jobs found. Try adjusting your search criteria.")
@@ -323,18 +330,23 @@ class JobScraper:
         with col4:
             remote_jobs = len([job for job in filtered_jobs if 'remote' in job['location'].lower()])
             st.metric("Remote Jobs", remote_jobs)
+        
+        # Market-wide salary distribution for this role from all ingested postings
+        if stats_key:
+            market = salary_stats.quantiles(role=stats_key)
+            if market:
+                st.caption(
+                    f"💰 Market salary for {stats_key} ({market['count']} postings): "
+                    f"p25 ${market['p25']:,.0f} · median ${market['p50']:,.0f} · p90 ${market['p90']:,.0f}"
+                )
     
     def _calculate_average_salary(self, jobs: list) -> str:
         """Calculate average salary from job list"""
         salaries = []
         for job in jobs:
-            salary_str = job['salary']
-            # Extract numbers from salary string
-            import re
-            numbers = re.findall(r'\d+', salary_str.replace(',', ''))
-            if len(numbers) >= 2:
-                avg = (int(numbers[0]) + int(numbers[1])) / 2
-                salaries.append(avg)
+            midpoint = parse_salary_range(job['salary'])
+            if midpoint is not None:
+                salaries.append(midpoint)
         
         if salaries:
             avg_salary = sum(salaries) / len(salaries)
@@ -1,17 +1,36 @@
-import os, json, re
-import google.generativeai as genai
-
-# Configure once at import
-API_KEY = os.getenv("GEMINI_API_KEY")
-if not API_KEY:
-    raise RuntimeError("Missing GEMINI_API_KEY in environment (.env)")
-genai.configure(api_key=API_KEY)
+import os, json, re, threading
+from core.metrics import timed
+from core.roadmap import Roadmap
 
 MODEL_NAME = os.getenv("LLM_MODEL", "gemini-1.5-flash")
-MODEL = genai.GenerativeModel(MODEL_NAME)
 
-def _call_gemini(prompt: str) -> str:
-    resp = MODEL.generate_content(prompt)
+_model = None
+_model_lock = threading.Lock()
+
+def get_model():
+    """The Gemini model, configured on first use (google.generativeai takes ~0.6 s to import)."""
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                import google.generativeai as genai
+                api_key = os.getenv("GEMINI_API_KEY")
+                if not api_key:
+                    raise RuntimeError("Missing GEMINI_API_KEY in environment (.env)")
+                genai.configure(api_key=api_key)
+                _model = genai.GenerativeModel(MODEL_NAME)
+    return _model
+
+def get_chat_model(system_instruction: str):
+    """A model carrying its own system instruction, so no setup message is needed (cheap; no network)."""
+    import google.generativeai as genai
+    get_model()  # configures the API key
+    return genai.GenerativeModel(MODEL_NAME, system_instruction=system_instruction)
+
+@timed("llm.call_gemini")
+def _call_gemini(prompt: str, json_output: bool = False) -> str:
+    config = {"response_mime_type": "application/json"} if json_output else None
+    resp = get_model().generate_content(prompt, generation_config=config)
     return (resp.text or "").strip()
 
 def extract_skills(text: str):
@@ -29,24 +48,30 @@ TEXT:
     except Exception:
         return [s.strip("- *•\t ").strip() for s in raw.splitlines() if s.strip()][:15]
 
-def generate_roadmap(profile: dict, target_role: str, gaps: list[str], hours: int, style: str) -> str:
-    """Produce a concise, weekly roadmap, personalized to user preferences."""
+def generate_roadmap(profile: dict, target_role: str, gaps: list[str], hours: int, style: str,
+                     weeks: int = 6) -> Roadmap:
+    """Produce a concise, weekly roadmap, personalized to user preferences.
+
+    Asks for JSON (weeks -> tasks -> resources) and validates it; a markdown reply is
+    parsed as a fallback. Raises ValueError if neither has any tasks.
+    """
     skills = profile.get("skills", [])
     prompt = f"""
-You are a career advisor. Create a **6-week, practical roadmap** for becoming a {target_role}.
+You are a career advisor. Create a **{weeks}-week, practical roadmap** for becoming a {target_role}.
 USER PROFILE:
 - Current skills: {skills}
 - Skill gaps to address: {gaps}
 - Can commit {hours} hours per week.
 - Prefers a learning style focused on: {style}.
 CONSTRAINTS:
-- Keep it under ~300 words.
-- Structure into weekly phases (Week 1..6) with 3-5 bulleted tasks each.
-- Prioritize free/low-cost resources (MOOCs, YouTube, docs).
+- Structure into weekly phases (Week 1..{weeks}) with 3-5 short tasks each.
+- Prioritize free/low-cost resources (MOOCs, YouTube, docs); give each task 0-2 resources.
 - Include one small portfolio project idea and job-search activities.
-- Return clean Markdown.
+- Return ONLY JSON in this shape:
+{{"title": "...", "summary": "one or two sentences",
+  "weeks": [{{"title": "theme of the week", "tasks": [{{"task": "...", "resources": [{{"title": "...", "url": "https://..."}}]}}]}}]}}
 """
-    return _call_gemini(prompt)
+    return Roadmap.parse(_call_gemini(prompt, json_output=True))
 
 def suggest_skills_for_role(role: str) -> list[str]:
     """Uses Gemini to find current, in-demand skills for a given job role."""
@@ -119,4 +144,17 @@ Generate a mix of 4 interview questions for this candidate:
 For each question, provide a brief, one-sentence hint on what a great answer should cover.
 Format the output as clean Markdown.
 """
-    return _call_gemini(prompt)
\ No newline at end of file
+    return _call_gemini(prompt)
+
+def summarize_conversation(summary: str, turns: list[dict]) -> str:
+    """Folds older chat turns ([{"role", "text"}]) into the running summary of a conversation."""
+    transcript = "\n".join(f"{t['role'].upper()}: {t['text']}" for t in turns)
+    prompt = f"""
+You maintain the memory of a career coaching conversation. Update the summary below with the new turns.
+Keep facts about the user (goals, skills, constraints, decisions) and advice already given. Under 150 words, plain prose.
+CURRENT SUMMARY:
+{summary or "(none yet)"}
+NEW TURNS:
+{transcript}
+"""
+    return _call_gemini(prompt)
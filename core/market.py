@@ -0,0 +1,52 @@
+import random
+
+PREMIUM_SKILLS = {'AI', 'Machine Learning', 'AWS', 'Kubernetes', 'React', 'Python'}
+
+def estimate_salary(occupation: dict) -> tuple[int, bool]:
+    """(simulated salary, has premium skills) from a role's skill complexity and demand.
+
+    The +/-15% variation is seeded by the role name, so a role gets the same estimate on
+    every rerun and in every session (and its chart can be cached).
+    """
+    skills = occupation.get('skills_required', [])
+    skill_complexity = sum(s['weight'] for s in skills)
+    base_salary = 45000 + (skill_complexity * 6000) + (len(skills) * 2500)
+    estimated_salary = int(base_salary * random.Random(occupation['occupation']).uniform(0.85, 1.15))
+    has_premium = any(s['skill'] in PREMIUM_SKILLS for s in skills)
+    if has_premium:
+        estimated_salary = int(estimated_salary * 1.2)
+    return estimated_salary, has_premium
+
+def _summary_for(catalog) -> dict:
+    skill_counts = {}
+    for occ in catalog.occupations:
+        for skill_obj in occ.get('skills_required', []):
+            skill_counts[skill_obj['skill']] = skill_counts.get(skill_obj['skill'], 0) + 1
+    top_skills = sorted(skill_counts.items(), key=lambda kv: -kv[1])[:10]
+
+    salaries = []
+    for occ in catalog.occupations:
+        estimated_salary, has_premium = estimate_salary(occ)
+        salaries.append({'Role': occ['occupation'], 'Estimated_Salary': estimated_salary,
+                         'Has_Premium_Skills': has_premium})
+    salaries.sort(key=lambda r: -r['Estimated_Salary'])
+
+    def mean(rows):
+        return sum(r['Estimated_Salary'] for r in rows) / len(rows) if rows else float('nan')
+    premium_avg = mean([r for r in salaries if r['Has_Premium_Skills']])
+    regular_avg = mean([r for r in salaries if not r['Has_Premium_Skills']])
+    return {
+        'unique_skills': len(skill_counts),
+        'top_skills': [{'Skill': skill, 'Frequency': count} for skill, count in top_skills],
+        'salaries': salaries,
+        'average_salary': mean(salaries),
+        'premium_boost': (premium_avg - regular_avg) / regular_avg * 100,
+    }
+
+def get_market_summary(catalog=None) -> dict:
+    """Skill demand and salary estimates for the given (default: current) data snapshot, computed once per reload.
+
+    Treat the result as read-only; it is shared by every session.
+    """
+    from core.registry import derived, get_catalog
+    return derived(_summary_for, catalog or get_catalog())
@@ -0,0 +1,67 @@
+import hashlib, os, threading
+from collections import OrderedDict
+import numpy as np
+
+# Entries are top-k result lists, so even a large memo stays a few MB
+RANK_MEMO_SIZE = int(os.getenv("RANK_MEMO_SIZE", "4096"))
+
+class RankingMemo:
+    """Process-wide LRU of ranking results, shared by every session and request.
+
+    Keys are the dataset version, top_k and a digest of the sorted skill ids the
+    catalog knows (unknown skills can't change a ranking, so "Python, Foo" and
+    "Python" share an entry). Entries from an older dataset version are dropped
+    as soon as a newer version is seen.
+    """
+
+    def __init__(self, maxsize: int = RANK_MEMO_SIZE):
+        self.maxsize = maxsize
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, index, user_skills, top_k: int, partial_credit: dict | None = None) -> tuple:
+        user_set = set(user_skills)
+        ids = sorted({index.skill_ids[s] for s in user_set if s in index.skill_ids})
+        digest = hashlib.blake2b(np.asarray(ids, dtype=np.int64).tobytes(), digest_size=16)
+        if partial_credit:
+            credits = sorted((index.skill_ids[s], c) for s, c in partial_credit.items()
+                             if s in index.skill_ids and s not in user_set)
+            digest.update(repr(credits).encode())
+        return index.version, top_k, digest.hexdigest()
+
+    def get(self, key: tuple):
+        with self._lock:
+            matches = self._entries.get(key)
+            if matches is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _copy(matches)
+
+    def put(self, key: tuple, matches: list[dict]):
+        with self._lock:
+            if key[0] != self.version:
+                self._entries.clear()
+                self.version = key[0]
+            self._entries[key] = _copy(matches)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.version = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits,
+                    "misses": self.misses, "version": self.version}
+
+def _copy(matches: list[dict]) -> list[dict]:
+    # Callers get their own dicts and gap lists, so no session can edit another's results
+    return [{**m, "gaps": list(m["gaps"])} for m in matches]
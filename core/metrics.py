@@ -0,0 +1,170 @@
+import bisect, functools, json, logging, os, threading, time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Prometheus-style latency buckets, in seconds
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+logger = logging.getLogger(__name__)
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+_histograms = {}
+_lock = threading.Lock()
+_local = threading.local()
+_exporters_started = False
+
+def _observe_histogram(name: str, seconds: float):
+    with _lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = Histogram()
+        hist.observe(seconds)
+
+def observe(name: str, seconds: float):
+    """Records one externally measured timing into the histogram and the current rerun's breakdown."""
+    _observe_histogram(name, seconds)
+    spans = getattr(_local, "spans", None)
+    if spans is not None:
+        spans.append((name, seconds, getattr(_local, "depth", 0)))
+
+@contextmanager
+def span(name: str):
+    """Times the enclosed block: `with metrics.span("matches.render"): ...`"""
+    depth = getattr(_local, "depth", 0)
+    spans = getattr(_local, "spans", None)
+    # Reserve the slot on entry so parents are listed before their children
+    slot = None
+    if spans is not None:
+        slot = len(spans)
+        spans.append((name, 0.0, depth))
+    _local.depth = depth + 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        _local.depth = depth
+        _observe_histogram(name, seconds)
+        if slot is not None and getattr(_local, "spans", None) is spans:
+            spans[slot] = (name, seconds, depth)
+
+def timed(name: str | None = None):
+    """Decorator form of span(); defaults to the function's module-qualified name."""
+    def decorator(fn):
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def start_rerun(page: str):
+    """Resets the per-rerun breakdown. Call at the top of each Streamlit page."""
+    _local.spans = []
+    _local.depth = 0
+    _local.page = page
+    _local.rerun_start = time.perf_counter()
+    _ensure_exporters()
+    # Sessions can deep-link to any page, so whichever rerun comes first starts the preload
+    from core import warmup
+    warmup.start()
+
+def last_rerun() -> dict:
+    """The spans recorded on this thread since start_rerun()."""
+    return {
+        "page": getattr(_local, "page", None),
+        "elapsed": time.perf_counter() - getattr(_local, "rerun_start", time.perf_counter()),
+        "spans": list(getattr(_local, "spans", [])),
+    }
+
+def snapshot() -> dict:
+    """{name: {"count", "sum", "buckets"}} for every recorded span."""
+    with _lock:
+        return {
+            name: {"count": h.count, "sum": h.total, "buckets": list(h.counts)}
+            for name, h in _histograms.items()
+        }
+
+def render_prometheus() -> str:
+    """All histograms in the Prometheus text exposition format."""
+    lines = [
+        "# HELP career_advisor_span_seconds Time spent in instrumented hot paths.",
+        "# TYPE career_advisor_span_seconds histogram",
+    ]
+    for name, data in sorted(snapshot().items()):
+        cumulative = 0
+        for bound, count in zip(list(BUCKETS) + ["+Inf"], data["buckets"]):
+            cumulative += count
+            lines.append(f'career_advisor_span_seconds_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'career_advisor_span_seconds_sum{{span="{name}"}} {data["sum"]:.6f}')
+        lines.append(f'career_advisor_span_seconds_count{{span="{name}"}} {data["count"]}')
+    return "\n".join(lines) + "\n"
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def _log_periodically(interval: float):
+    while True:
+        time.sleep(interval)
+        logger.info(json.dumps({"metrics": snapshot(), "ts": time.time()}))
+
+def _ensure_exporters():
+    """Starts the exporters configured via env vars, once per process.
+
+    METRICS_PORT=9464        serve Prometheus text on http://0.0.0.0:9464/metrics
+    METRICS_LOG_INTERVAL=60  log a JSON snapshot every 60 seconds
+    """
+    global _exporters_started
+    if _exporters_started:
+        return
+    with _lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+    port = os.getenv("METRICS_PORT")
+    if port:
+        try:
+            server = ThreadingHTTPServer(("0.0.0.0", int(port)), _MetricsHandler)
+            threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True).start()
+        except OSError as e:
+            logger.warning("Could not start metrics endpoint on port %s: %s", port, e)
+    interval = os.getenv("METRICS_LOG_INTERVAL")
+    if interval:
+        threading.Thread(target=_log_periodically, args=(float(interval),), name="metrics-log", daemon=True).start()
+
+def debug_panel():
+    """Sidebar breakdown of the last rerun, shown with METRICS_DEBUG=1 or ?debug=1."""
+    import streamlit as st
+    if os.getenv("METRICS_DEBUG") != "1" and st.query_params.get("debug") != "1":
+        return
+    run = last_rerun()
+    with st.sidebar.expander("⏱️ Rerun Timings", expanded=False):
+        st.caption(f"{run['page']}: {run['elapsed'] * 1000:.1f} ms total")
+        if not run["spans"]:
+            st.write("No instrumented calls this rerun.")
+        for name, seconds, depth in run["spans"]:
+            st.text(f"{'  ' * depth}{name:<40} {seconds * 1000:8.1f} ms")
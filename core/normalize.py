@@ -1,20 +1,23 @@
-import json, pathlib, re
+import re
 from rapidfuzz import fuzz
+from core.metrics import timed
+from core.registry import get_catalog
 
-_TAX = json.loads(pathlib.Path("data/skills_taxonomy.json").read_text(encoding="utf-8"))
-
-def _alias(s: str) -> str:
+def _alias(s: str, taxonomy=None) -> str:
     k = s.lower().strip()
-    return _TAX.get(k, s)
+    taxonomy = get_catalog().taxonomy if taxonomy is None else taxonomy
+    return taxonomy.get(k, s)
 
-def normalize_skills(skills: list[str]) -> list[str]:
-    # Basic clean + alias map + fuzzy dedupe
+@timed("normalize.normalize_skills")
+def normalize_skills(skills: list[str], taxonomy=None) -> list[str]:
+    # Basic clean + alias map + fuzzy dedupe; pass the rerun's catalog.taxonomy for a consistent snapshot
+    taxonomy = get_catalog().taxonomy if taxonomy is None else taxonomy
     cleaned = []
     for s in skills:
         s = re.sub(r"[^a-zA-Z0-9+#.\s/-]", "", str(s)).strip()
         if not s: 
             continue
-        s = _alias(s)
+        s = _alias(s, taxonomy)
         cleaned.append(s)
 
     out = []
@@ -0,0 +1,72 @@
+import numpy as np
+
+class LearningPlanner:
+    """Picks the skills that raise a user's scores the most across their top-k roles.
+
+    The top roles are fixed when the planner is built. Their requirements become a
+    dense roles x skills matrix of score contributions (weight / role total), so the
+    gain of every candidate skill is one vectorized expression and toggling a skill
+    only adds or subtracts its column.
+    """
+
+    def __init__(self, index, user_skills: list[str], top_k: int = 10, target: float = 0.8):
+        self.target = target
+        user_set = set(user_skills)
+        raw = index.raw_scores(user_set)
+        matches = index.rank(user_skills, top_k=top_k)
+        self.roles = [m['occupation'] for m in matches]
+        self.skills = []
+        columns = {}
+        for m in matches:
+            for s in m["skills_required"]:
+                if s['skill'] not in columns:
+                    columns[s['skill']] = len(self.skills)
+                    self.skills.append(s['skill'])
+        self.columns = columns
+        self.weights = np.zeros((len(matches), len(self.skills)))
+        for row, m in enumerate(matches):
+            total = index.totals[index.occ_ids[m['occupation']]]
+            for s in m["skills_required"]:
+                self.weights[row, columns[s['skill']]] = s['weight'] / total
+        self.owned = np.array([s in user_set for s in self.skills], dtype=bool)
+        self.scores = np.array([raw[index.occ_ids[r]] / index.totals[index.occ_ids[r]] for r in self.roles])
+
+    def toggle(self, skill: str, owned: bool):
+        """Marks a skill as held or not; only that skill's column is touched."""
+        j = self.columns.get(skill)
+        if j is None or self.owned[j] == owned:
+            return
+        self.owned[j] = owned
+        self.scores += self.weights[:, j] if owned else -self.weights[:, j]
+
+    def gains(self, scores: np.ndarray | None = None, owned: np.ndarray | None = None) -> np.ndarray:
+        """Average score gain per candidate skill. Gains stop counting once a role reaches `target`."""
+        scores = self.scores if scores is None else scores
+        owned = self.owned if owned is None else owned
+        if not self.roles:
+            return np.zeros(len(self.skills))
+        capped = np.minimum(scores[:, None] + self.weights, self.target) - np.minimum(scores, self.target)[:, None]
+        gains = capped.sum(axis=0) / len(self.roles)
+        gains[owned] = 0
+        return gains
+
+    def plan(self, budget: int = 3) -> list[dict]:
+        """Greedy learning set of up to `budget` skills, re-evaluating gains after each pick."""
+        scores, owned = self.scores.copy(), self.owned.copy()
+        picked = []
+        for _ in range(budget):
+            gains = self.gains(scores, owned)
+            j = int(np.argmax(gains)) if len(gains) else 0
+            if not len(gains) or gains[j] <= 1e-9:
+                break
+            helped = [self.roles[r] for r in np.flatnonzero(self.weights[:, j])]
+            scores = scores + self.weights[:, j]
+            owned[j] = True
+            picked.append({"skill": self.skills[j], "gain": round(float(gains[j]), 3), "roles": helped})
+        return picked
+
+    def projected(self, plan: list[dict]) -> list[tuple[str, float, float]]:
+        """(role, current score, score after learning the plan) for each top role."""
+        added = [self.columns[p['skill']] for p in plan]
+        after = self.scores + self.weights[:, added].sum(axis=1)
+        return [(r, round(float(a), 3), round(float(b), 3)) for r, a, b in zip(self.roles, self.scores, after)]
@@ -0,0 +1,76 @@
+import cProfile, io, marshal, os, pstats, threading, time
+from datetime import datetime
+
+MAX_CAPTURES = 5  # most recent profiles kept per session
+
+_local = threading.local()
+
+def enabled() -> bool:
+    """Profiling is on with PROFILE_RERUNS=1 or the ?profile=1 query param."""
+    if os.getenv("PROFILE_RERUNS") == "1":
+        return True
+    import streamlit as st
+    return st.query_params.get("profile") == "1"
+
+def begin(page: str):
+    """Starts profiling this rerun. Call at the top of a page; a no-op unless enabled()."""
+    # A previous rerun on this thread may have ended in st.stop()/st.rerun() before end()
+    stale = getattr(_local, "active", None)
+    if stale is not None:
+        stale[0].disable()
+        _local.active = None
+    if not enabled():
+        return
+    profiler = cProfile.Profile()
+    _local.active = (profiler, page, time.perf_counter())
+    profiler.enable()
+
+def end(**input_size):
+    """Stops profiling, stores the capture in the session and offers it for download.
+
+    Keyword arguments describe the rerun's input, e.g. end(skills=12, occupations=20).
+    """
+    active = getattr(_local, "active", None)
+    if active is None:
+        return
+    profiler, page, started = active
+    profiler.disable()
+    _local.active = None
+    elapsed = time.perf_counter() - started
+
+    profiler.create_stats()
+    # Same layout as pstats.Stats.dump_stats, so `python -m pstats file.prof` and snakeviz can open it.
+    # Serialize first: pstats.Stats(profiler) takes ownership of profiler.stats.
+    dump = marshal.dumps(profiler.stats)
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(25)
+
+    import streamlit as st
+    captures = st.session_state.setdefault("profiles", [])
+    captures.append({
+        "page": page,
+        "input_size": input_size,
+        "elapsed": elapsed,
+        "captured_at": datetime.now().strftime("%H:%M:%S"),
+        "pstats": dump,
+        "summary": summary.getvalue(),
+    })
+    del captures[:-MAX_CAPTURES]
+    _render_captures(captures)
+
+def _render_captures(captures: list):
+    import streamlit as st
+    with st.sidebar.expander("🔬 Rerun Profiles", expanded=False):
+        for i, cap in enumerate(reversed(captures)):
+            size = ", ".join(f"{k}={v}" for k, v in cap["input_size"].items()) or "n/a"
+            st.caption(f"{cap['captured_at']} · {cap['page']} · {cap['elapsed'] * 1000:.0f} ms · {size}")
+            slug = cap["page"].lower().replace(" ", "_")
+            st.download_button(
+                "⬇️ Download .prof",
+                data=cap["pstats"],
+                file_name=f"{slug}_{cap['captured_at'].replace(':', '')}.prof",
+                mime="application/octet-stream",
+                key=f"profile_download_{i}_{cap['captured_at']}",
+            )
+            if i == 0:
+                st.code(cap["summary"], language=None)
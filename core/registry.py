@@ -0,0 +1,202 @@
+import hashlib, json, logging, os, pathlib, threading, time
+from types import MappingProxyType
+from core.index import OccupationIndex
+from core.hierarchy import SkillHierarchy
+
+logger = logging.getLogger(__name__)
+
+# Absolute, so the data loads the same from any working directory
+DATA_DIR = pathlib.Path(__file__).resolve().parent.parent / "data"
+
+# Point to the new, larger, AI-generated dataset.
+OCCUPATIONS_FILE = str(DATA_DIR / "occupations_expanded.json")
+TAXONOMY_FILE = str(DATA_DIR / "skills_taxonomy.json")
+HIERARCHY_FILE = str(DATA_DIR / "skills_hierarchy.json")
+
+# Seconds between data file checks; 0 disables hot reload
+RELOAD_INTERVAL = float(os.getenv("DATA_RELOAD_INTERVAL", "5"))
+
+class FrozenDict(dict):
+    """dict that refuses mutation, so shared records can be handed to every session.
+
+    Subclassing dict keeps `{**o}`, json.dumps and pandas working unchanged.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared catalog records are read-only; copy with dict(record) first")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __hash__(self):
+        return hash(tuple(sorted(self.items())))
+
+    def __reduce__(self):
+        # Default dict pickling refills via __setitem__, which is blocked
+        return FrozenDict, (dict(self),)
+
+def freeze(value):
+    """Deep read-only copy: dicts become FrozenDicts and lists become tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+class Catalog:
+    """Immutable snapshot of the data files plus everything derived from them.
+
+    One instance is shared by all sessions, threads and reruns in the process, so
+    nothing is copied per rerun; records, index tables and arrays are read-only.
+    A reload builds a new Catalog, and code still holding the old one keeps a
+    consistent view until it asks for the current snapshot again.
+    """
+
+    __slots__ = ("occupations", "version", "index", "taxonomy", "hierarchy")
+
+    def __init__(self, occupations, version: str, taxonomy: dict | None = None,
+                 hierarchy: SkillHierarchy | None = None, occupations_version: str | None = None):
+        object.__setattr__(self, "occupations", freeze(occupations))
+        object.__setattr__(self, "version", version)
+        # Rankings only depend on the occupations, so the index keeps its own version for core.memo
+        index = OccupationIndex(self.occupations, version=occupations_version or version).freeze()
+        object.__setattr__(self, "index", index)
+        object.__setattr__(self, "taxonomy", MappingProxyType(dict(taxonomy or {})))
+        object.__setattr__(self, "hierarchy", hierarchy or SkillHierarchy({}))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Catalog snapshots are immutable")
+
+    @classmethod
+    def from_files(cls, occupations_file: str = OCCUPATIONS_FILE, taxonomy_file: str = TAXONOMY_FILE,
+                   hierarchy_file: str = HIERARCHY_FILE) -> "Catalog":
+        occupations = pathlib.Path(occupations_file).read_bytes()
+        taxonomy, hierarchy = _read_optional(taxonomy_file), _read_optional(hierarchy_file)
+        return cls(json.loads(occupations),
+                   version=hashlib.sha1(b"\0".join((occupations, taxonomy, hierarchy))).hexdigest()[:12],
+                   taxonomy=json.loads(taxonomy or b"{}"),
+                   hierarchy=SkillHierarchy.from_dict(json.loads(hierarchy or b"{}")),
+                   occupations_version=hashlib.sha1(occupations).hexdigest()[:12])
+
+class DataRegistry:
+    """Holds the current Catalog and swaps in a rebuilt one when the data files change.
+
+    A daemon thread polls file mtimes and sizes every `interval` seconds. On a change
+    it rebuilds the whole Catalog off the request path and replaces the reference in
+    one assignment, so readers never wait. A failed rebuild (e.g. a half-written file)
+    keeps the old snapshot and is retried on the next poll. A forked child (e.g. a
+    pool worker) keeps the inherited snapshot but starts its own watcher, since
+    threads don't survive a fork.
+    """
+
+    def __init__(self, files: tuple = (OCCUPATIONS_FILE, TAXONOMY_FILE, HIERARCHY_FILE),
+                 interval: float = RELOAD_INTERVAL):
+        self.files = files
+        self.interval = interval
+        self._snapshot = None
+        self._stamp = None
+        self._lock = threading.Lock()
+        self._watcher = None
+
+    def snapshot(self) -> Catalog:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._stamp = self._file_stamp()
+                    self._snapshot = Catalog.from_files(*self.files)
+                snapshot = self._snapshot
+        if self._watcher is None:
+            self._start_watcher()
+        return snapshot
+
+    def reload(self, force: bool = False) -> bool:
+        """Rebuilds and swaps if the files changed (or always, with force). True if swapped."""
+        stamp = self._file_stamp()
+        if not force and stamp == self._stamp:
+            return False
+        try:
+            catalog = Catalog.from_files(*self.files)
+        except (OSError, ValueError) as e:
+            logger.warning("Data reload failed, keeping the current snapshot: %s", e)
+            return False
+        with self._lock:
+            self._stamp = stamp
+            # A touched but unchanged file hashes to the same version; keep the warm snapshot
+            if self._snapshot is not None and catalog.version == self._snapshot.version:
+                return False
+            self._snapshot = catalog
+        logger.info("Data reloaded: version %s, %d occupations", catalog.version, len(catalog.occupations))
+        return True
+
+    def _after_fork(self):
+        # The parent's watcher thread and any lock it held don't exist in the child
+        self._lock = threading.Lock()
+        self._watcher = None
+
+    def _file_stamp(self) -> tuple:
+        stamp = []
+        for path in self.files:
+            try:
+                stat = os.stat(path)
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _start_watcher(self):
+        if self.interval <= 0 or self._watcher is not None:
+            return
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._watch, name="data-registry", daemon=True)
+                self._watcher.start()
+
+    def _watch(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.reload()
+            except Exception:
+                logger.exception("Data reload check failed")
+
+def _read_optional(path: str) -> bytes:
+    p = pathlib.Path(path)
+    return p.read_bytes() if p.exists() else b""
+
+registry = DataRegistry()
+
+def get_catalog() -> Catalog:
+    """The current snapshot. Take it once per rerun or request for a consistent view."""
+    return registry.snapshot()
+
+_derived_catalog = None
+_derived = {}
+_derived_lock = threading.Lock()
+
+def _after_fork():
+    global _derived_lock
+    registry._after_fork()
+    _derived_lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):  # POSIX only; spawned processes start fresh anyway
+    os.register_at_fork(after_in_child=_after_fork)
+
+def derived(build, catalog: Catalog):
+    """build(catalog), cached for the current snapshot only, so derived structures follow reloads.
+
+    The cache is dropped when a new snapshot is seen, so a retired catalog and what was
+    built from it can be freed. A rerun still holding a retired snapshot gets an uncached build.
+    """
+    global _derived_catalog
+    with _derived_lock:
+        if catalog is _derived_catalog and build in _derived:
+            return _derived[build]
+    value = build(catalog)
+    with _derived_lock:
+        if catalog is registry._snapshot:
+            if catalog is not _derived_catalog:
+                _derived_catalog = catalog
+                _derived.clear()
+            value = _derived.setdefault(build, value)
+    return value
@@ -1,7 +1,9 @@
-import pdfplumber
 from typing import Optional, BinaryIO
+from core.metrics import timed
 
+@timed("resume.extract_text_from_pdf")
 def extract_text_from_pdf(file: BinaryIO) -> str:
+    import pdfplumber  # ~90 ms to import; only needed once a PDF is uploaded
     text = []
     with pdfplumber.open(file) as pdf:
         for p in pdf.pages:
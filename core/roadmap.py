@@ -0,0 +1,128 @@
+import hashlib, json, re
+
+MAX_WEEKS = 12
+MAX_TASKS_PER_WEEK = 8
+MAX_RESOURCES_PER_TASK = 3
+
+class Roadmap:
+    """A validated weekly roadmap: weeks -> tasks -> resources.
+
+    Built once when the roadmap is generated; pages render from it and look up progress
+    by task id without reparsing anything. Task ids are "w{week}_t{n}", stable for the
+    life of the roadmap, and `key` is a digest of the content for namespacing widget keys
+    so a regenerated roadmap doesn't inherit the old checkboxes.
+    """
+
+    __slots__ = ("title", "summary", "weeks", "task_ids", "key")
+
+    def __init__(self, weeks: list[dict], title: str = "", summary: str = ""):
+        self.title = title
+        self.summary = summary
+        self.weeks = weeks
+        self.task_ids = tuple(task["id"] for week in weeks for task in week["tasks"])
+        digest = json.dumps([title, summary, weeks], sort_keys=True).encode()
+        self.key = hashlib.blake2b(digest, digest_size=6).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self.weeks)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Roadmap":
+        """Validates model output shaped like {"title", "summary", "weeks": [{"title", "tasks": [{"task", "resources"}], "notes"}]}.
+
+        Weeks are renumbered by position, empty tasks dropped and lists capped. A lone
+        string where a list belongs becomes a one-item list; raises ValueError for any
+        other non-list or if no week has a task.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("weeks"), list):
+            raise ValueError("Roadmap JSON needs a 'weeks' list")
+        weeks = []
+        for raw_week in data["weeks"][:MAX_WEEKS]:
+            if not isinstance(raw_week, dict):
+                continue
+            number = len(weeks) + 1
+            tasks = []
+            for raw_task in _list(raw_week.get("tasks"), "tasks"):
+                if isinstance(raw_task, str):
+                    raw_task = {"task": raw_task}
+                if not isinstance(raw_task, dict):
+                    continue
+                text = _text(raw_task.get("task") or raw_task.get("title"))
+                if not text:
+                    continue
+                resources = [r for r in map(_resource, _list(raw_task.get("resources"), "resources")) if r]
+                tasks.append({"id": f"w{number}_t{len(tasks) + 1}", "text": text,
+                              "resources": resources[:MAX_RESOURCES_PER_TASK]})
+                if len(tasks) == MAX_TASKS_PER_WEEK:
+                    break
+            weeks.append({"week": number, "title": _text(raw_week.get("title") or raw_week.get("theme")),
+                          "tasks": tasks, "notes": _text(raw_week.get("notes"))})
+        if not any(week["tasks"] for week in weeks):
+            raise ValueError("Roadmap has no tasks")
+        return cls(weeks, _text(data.get("title")), _text(data.get("summary")))
+
+    @classmethod
+    def from_markdown(cls, text: str) -> "Roadmap":
+        """Fallback for a model that ignored the JSON format: "## Week" headings with bulleted tasks."""
+        weeks, summary = [], []
+        for line in text.split('\n'):
+            stripped = line.strip()
+            if stripped.startswith('#') and 'Week' in stripped:
+                title = re.sub(r"^#+\s*(\*\*)?Week\s*\d+\s*[:.\-–]?\s*", "", stripped).strip("* ")
+                weeks.append({"title": title, "tasks": [], "notes": []})
+            elif re.match(r"[-*•]\s", stripped) and weeks:
+                weeks[-1]["tasks"].append(stripped[1:].strip())
+            elif stripped:
+                (weeks[-1]["notes"] if weeks else summary).append(stripped)
+        for week in weeks:
+            week["notes"] = "\n".join(week["notes"])
+        return cls.from_dict({"weeks": weeks, "summary": "\n".join(summary)})
+
+    @classmethod
+    def parse(cls, raw: str) -> "Roadmap":
+        """From the model's reply: JSON if it parses and validates, otherwise markdown."""
+        cleaned = re.sub(r"^```(json)?|```$", "", raw.strip(), flags=re.IGNORECASE | re.MULTILINE).strip()
+        try:
+            return cls.from_dict(json.loads(cleaned))
+        except ValueError:  # json.JSONDecodeError is a ValueError
+            return cls.from_markdown(raw)
+
+    def progress(self, done: dict) -> tuple[int, int]:
+        """(completed tasks, total tasks) for a {task id: done} mapping."""
+        return sum(1 for task_id in self.task_ids if done.get(task_id)), len(self.task_ids)
+
+    def to_markdown(self) -> str:
+        """Plain markdown, e.g. for prompts."""
+        lines = [f"# {self.title}"] if self.title else []
+        if self.summary:
+            lines.append(self.summary)
+        for week in self.weeks:
+            lines.append(f"## Week {week['week']}" + (f": {week['title']}" if week['title'] else ""))
+            for task in week["tasks"]:
+                links = ", ".join(f"[{r['title']}]({r['url']})" if r['url'] else r['title'] for r in task["resources"])
+                lines.append(f"- {task['text']}" + (f" ({links})" if links else ""))
+            if week["notes"]:
+                lines.append(week["notes"])
+        return "\n".join(lines)
+
+def _list(value, field: str) -> list:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if not isinstance(value, list):
+        raise ValueError(f"Roadmap '{field}' must be a list")
+    return value
+
+def _text(value) -> str:
+    return str(value).strip() if isinstance(value, (str, int, float)) else ""
+
+def _resource(raw) -> dict | None:
+    if isinstance(raw, str):
+        raw = {"url": raw} if raw.startswith("http") else {"title": raw}
+    if not isinstance(raw, dict):
+        return None
+    url = _text(raw.get("url"))
+    url = url if url.startswith(("http://", "https://")) else ""
+    title = _text(raw.get("title") or raw.get("name")) or url
+    return {"title": title, "url": url} if title else None
@@ -0,0 +1,174 @@
+import math, re, threading
+from typing import Optional
+
+def parse_salary_range(salary_str: str) -> Optional[float]:
+    """Returns the midpoint of a "$90,000 - $140,000" style range, or None."""
+    numbers = re.findall(r'\d+', str(salary_str).replace(',', ''))
+    if len(numbers) >= 2:
+        return (int(numbers[0]) + int(numbers[1])) / 2
+    return None
+
+class TDigest:
+    """Mergeable quantile sketch (merging t-digest) with a bounded number of centroids."""
+
+    def __init__(self, compression: int = 100):
+        self.compression = compression
+        self.centroids = []  # sorted [mean, weight] pairs
+        self._buffer = []
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, weight: float = 1):
+        self._buffer.append([float(value), weight])
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self.compression * 5:
+            self._compress()
+
+    def merge(self, other: "TDigest"):
+        """Folds another digest into this one (e.g. a partial result from another worker)."""
+        other._compress()
+        self._buffer.extend([m, w] for m, w in other.centroids)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        items = sorted(self.centroids + self._buffer)
+        self._buffer = []
+        total = sum(w for _, w in items)
+        merged = []
+        cur_mean, cur_weight = items[0]
+        weight_so_far = 0
+        for mean, weight in items[1:]:
+            proposed = cur_weight + weight
+            q = (weight_so_far + proposed / 2) / total
+            # Centroids near the tails stay small, which keeps p10/p90 accurate
+            limit = 4 * total * q * (1 - q) / self.compression
+            if proposed <= max(1, limit):
+                cur_mean += (mean - cur_mean) * weight / proposed
+                cur_weight = proposed
+            else:
+                merged.append([cur_mean, cur_weight])
+                weight_so_far += cur_weight
+                cur_mean, cur_weight = mean, weight
+        merged.append([cur_mean, cur_weight])
+        self.centroids = merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        self._compress()
+        if not self.centroids:
+            return None
+        if len(self.centroids) == 1:
+            return self.centroids[0][0]
+        target = q * self.count
+        first_mean, first_weight = self.centroids[0]
+        if target < first_weight / 2:
+            return self.min + (first_mean - self.min) * target / (first_weight / 2)
+        cum = 0
+        for (m1, w1), (m2, w2) in zip(self.centroids, self.centroids[1:]):
+            mid1 = cum + w1 / 2
+            mid2 = cum + w1 + w2 / 2
+            if target <= mid2:
+                return m1 + (m2 - m1) * (target - mid1) / (mid2 - mid1)
+            cum += w1
+        last_mean, last_weight = self.centroids[-1]
+        remaining = self.count - target
+        return self.max - (self.max - last_mean) * remaining / (last_weight / 2)
+
+    def to_dict(self) -> dict:
+        self._compress()
+        return {
+            "compression": self.compression,
+            "centroids": self.centroids,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TDigest":
+        digest = cls(data.get("compression", 100))
+        digest.centroids = [[float(m), w] for m, w in data.get("centroids", [])]
+        digest.count = sum(w for _, w in digest.centroids)
+        if digest.count:
+            digest.min = data["min"]
+            digest.max = data["max"]
+        return digest
+
+class SalaryStats:
+    """Per-role and per-location salary distributions, updated as job postings are ingested."""
+
+    def __init__(self, compression: int = 100):
+        self.compression = compression
+        self.by_role = {}
+        self.by_location = {}
+        self._lock = threading.Lock()
+
+    def ingest(self, jobs: list, role: str):
+        """Adds the salary midpoints of freshly generated/scraped postings."""
+        with self._lock:
+            for job in jobs:
+                midpoint = parse_salary_range(job.get('salary', ''))
+                if midpoint is None:
+                    continue
+                self._digest(self.by_role, role).add(midpoint)
+                self._digest(self.by_location, job.get('location') or "Unknown").add(midpoint)
+
+    def _digest(self, table: dict, key: str) -> TDigest:
+        if key not in table:
+            table[key] = TDigest(self.compression)
+        return table[key]
+
+    def quantiles(self, role: str | None = None, location: str | None = None, qs=(0.25, 0.5, 0.9)) -> Optional[dict]:
+        """Returns {"count", "p25", "p50", "p90"} for a role or a location, or None if nothing was ingested."""
+        table, key = (self.by_role, role) if role is not None else (self.by_location, location)
+        with self._lock:
+            digest = table.get(key)
+            if digest is None or not digest.count:
+                return None
+            result = {"count": int(digest.count)}
+            for q in qs:
+                result[f"p{round(q * 100)}"] = digest.quantile(q)
+        return result
+
+    def summary(self, by: str = "role") -> list[dict]:
+        """Quantile rows for every role (or location) seen so far."""
+        table = self.by_role if by == "role" else self.by_location
+        with self._lock:
+            keys = sorted(table)
+        rows = []
+        for key in keys:
+            stats = self.quantiles(role=key) if by == "role" else self.quantiles(location=key)
+            if stats:
+                rows.append({by.capitalize(): key, **stats})
+        return rows
+
+    def merge(self, other: "SalaryStats"):
+        """Merges partial results, e.g. from another worker process."""
+        with self._lock:
+            for mine, theirs in ((self.by_role, other.by_role), (self.by_location, other.by_location)):
+                for key, digest in theirs.items():
+                    self._digest(mine, key).merge(digest)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "compression": self.compression,
+                "by_role": {k: d.to_dict() for k, d in self.by_role.items()},
+                "by_location": {k: d.to_dict() for k, d in self.by_location.items()},
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SalaryStats":
+        stats = cls(data.get("compression", 100))
+        stats.by_role = {k: TDigest.from_dict(d) for k, d in data.get("by_role", {}).items()}
+        stats.by_location = {k: TDigest.from_dict(d) for k, d in data.get("by_location", {}).items()}
+        return stats
+
+# Process-wide sketches shared by every session
+salary_stats = SalaryStats()
@@ -1,21 +1,48 @@
-import json, pathlib
-from typing import List, Dict
-import streamlit as st
-
-@st.cache_data
-def load_occupations() -> List[Dict]:
-    """Loads and caches the occupations data from the JSON file."""
-    # Point to the new, larger, AI-generated dataset.
-    return json.loads(pathlib.Path("data/occupations_expanded.json").read_text(encoding="utf-8"))
-
-def rank_roles(user_skills: list[str], occupations: list[dict], top_k: int = 5):
-    """Ranks roles based on a weighted score of matching skills."""
-    user_set = set(user_skills)
+from core.metrics import timed
+from core.index import OccupationIndex
+from core.memo import RankingMemo
+from core.registry import get_catalog
+from core.hierarchy import get_hierarchy
+
+def load_occupations() -> tuple:
+    """The shared, read-only occupation records (no per-rerun copy)."""
+    return get_catalog().occupations
+
+ranking_memo = RankingMemo()
+
+def get_index() -> OccupationIndex:
+    """Compiled occupation index, built once per process (no Streamlit runtime needed)."""
+    return get_catalog().index
+
+def rank_cached(user_skills: list[str], top_k: int = 5, partial_credit: dict | None = None,
+                index: OccupationIndex | None = None) -> list[dict]:
+    """index.rank() (default: get_index()) through the shared memo; identical skill sets are ranked once per process."""
+    index = index or get_index()
+    key = ranking_memo.key(index, user_skills, top_k, partial_credit)
+    matches = ranking_memo.get(key)
+    if matches is None:
+        matches = index.rank(user_skills, top_k, partial_credit)
+        ranking_memo.put(key, matches)
+    return matches
+
+@timed("scoring.rank_roles")
+def rank_roles(user_skills: list[str], occupations: list[dict], top_k: int = 5, partial_credit: dict | None = None,
+               expand_implied: bool = False):
+    """Ranks roles based on a weighted score of matching skills.
+
+    partial_credit optionally maps skills the user lacks to a 0..1 fraction of their
+    weight (see similarity.partial_credit); they still count as gaps. With
+    expand_implied, skills implied by the user's (see core.hierarchy) count as held.
+    """
+    user_set = get_hierarchy().expand(user_skills) if expand_implied else set(user_skills)
     results = []
     for o in occupations:
         req_skills_with_weights = o.get("skills_required", [])
         total_possible_score = sum(s['weight'] for s in req_skills_with_weights)
         user_score = sum(s['weight'] for s in req_skills_with_weights if s['skill'] in user_set)
+        if partial_credit:
+            user_score += sum(s['weight'] * partial_credit.get(s['skill'], 0)
+                              for s in req_skills_with_weights if s['skill'] not in user_set)
         normalized_score = user_score / max(1, total_possible_score)
         req_skills_list = [s['skill'] for s in req_skills_with_weights]
         gaps = [s for s in req_skills_list if s not in user_set]
@@ -23,6 +50,11 @@ def rank_roles(user_skills: list[str], occupations: list[dict], top_k: int = 5):
     results.sort(key=lambda x: x["score"], reverse=True)
     return results[:top_k]
 
+def rank_many(users: list[list[str]], occupations: list[dict] | None = None, top_k: int = 5) -> list[list[dict]]:
+    """Ranks many users at once via sparse matrix products; one rank_roles-style list per user."""
+    index = get_index() if occupations is None else OccupationIndex(occupations)
+    return index.rank_many(users, top_k)
+
 def skill_gaps(target_role: dict, user_skills: list[str]):
     req_skills = [s['skill'] for s in target_role.get("skills_required", [])]
     return [s for s in req_skills if s not in set(user_skills)]
\ No newline at end of file
@@ -0,0 +1,85 @@
+import json, logging, pathlib, functools
+import numpy as np
+from core.registry import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+NEIGHBORS_FILE = str(DATA_DIR / "skill_neighbors.json")
+DESCRIPTIONS_FILE = str(DATA_DIR / "skill_descriptions.json")
+
+# Partial credit is the neighbor similarity scaled down, so a near skill never counts as much as the real one
+PARTIAL_CREDIT_SCALE = 0.6
+
+def build_neighbors(skills: list[str], targets: list[str], descriptions: dict | None = None,
+                    top_n: int = 10, min_sim: float = 0.25, char_weight: float = 0.4,
+                    min_word_sim: float = 0.3, linked: set | None = None) -> dict:
+    """Top-n similar target skills for every skill, from character + word TF-IDF vectors.
+
+    Character n-grams catch spelling variants ("Version Control (Git)" ~ "Git"); word
+    TF-IDF over the optional descriptions catches related concepts ("PyTorch" ~ "Deep Learning").
+    Names alone are weak evidence ("Java" ~ "JavaScript", "A/B Testing" ~ "API Testing"),
+    so a pair is only kept if its word similarity reaches min_word_sim or it is in
+    `linked`, a set of (skill, target) pairs from the skill hierarchy.
+    Offline step: see build_skill_neighbors.py.
+    """
+    from scipy import sparse
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.preprocessing import normalize
+
+    descriptions = descriptions or {}
+    vocab = sorted(set(skills) | set(targets))
+    docs = [f"{s} {descriptions.get(s, '')}" for s in vocab]
+    chars = TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), lowercase=True).fit_transform(vocab)
+    words = TfidfVectorizer(analyzer="word", token_pattern=r"[A-Za-z0-9+#.]+", lowercase=True,
+                            sublinear_tf=True).fit_transform(docs)
+    vectors = normalize(sparse.hstack([chars * np.sqrt(char_weight), words * np.sqrt(1 - char_weight)]).tocsr())
+    words = normalize(words.tocsr())
+    linked = linked or set()
+
+    position = {s: i for i, s in enumerate(vocab)}
+    target_rows = [position[t] for t in targets]
+    target_vectors = vectors[target_rows]
+    target_words = words[target_rows]
+    neighbors = {}
+    for start in range(0, len(skills), 1024):
+        chunk = skills[start:start + 1024]
+        rows = [position[s] for s in chunk]
+        sims = (vectors[rows] @ target_vectors.T).toarray()
+        word_sims = (words[rows] @ target_words.T).toarray()
+        for skill, row, word_row in zip(chunk, sims, word_sims):
+            order = np.argsort(-row, kind="stable")
+            picked = []
+            for j in order:
+                if row[j] < min_sim or len(picked) == top_n:
+                    break
+                if targets[j] != skill and (word_row[j] >= min_word_sim or (skill, targets[j]) in linked):
+                    picked.append([targets[j], round(float(row[j]), 3)])
+            if picked:
+                neighbors[skill] = picked
+    return neighbors
+
+@functools.lru_cache(maxsize=1)
+def load_neighbors(path: str = NEIGHBORS_FILE) -> dict:
+    """Neighbor table built by build_skill_neighbors.py, loaded once per process. Empty if missing."""
+    p = pathlib.Path(path)
+    if not p.exists():
+        logger.warning("No skill neighbor table at %s; related skills get no partial credit. "
+                       "Run build_skill_neighbors.py to create it.", p)
+        return {}
+    return json.loads(p.read_text(encoding="utf-8"))["neighbors"]
+
+def related_skills(user_skills: list[str], neighbors: dict | None = None) -> dict:
+    """{skill the user lacks: (credit, user skill it comes from)} for near skills."""
+    neighbors = load_neighbors() if neighbors is None else neighbors
+    user_set = set(user_skills)
+    related = {}
+    for skill in user_set:
+        for near, sim in neighbors.get(skill, ()):
+            credit = sim * PARTIAL_CREDIT_SCALE
+            if near not in user_set and credit > related.get(near, (0, None))[0]:
+                related[near] = (credit, skill)
+    return related
+
+def partial_credit(user_skills: list[str], neighbors: dict | None = None) -> dict:
+    """{skill: 0..1 credit} for rank_roles(partial_credit=...)."""
+    return {skill: credit for skill, (credit, _) in related_skills(user_skills, neighbors).items()}
@@ -0,0 +1,94 @@
+import json, os, pathlib, re, threading, time, uuid
+
+# One JSON-lines file per conversation; gitignored. Anyone holding a ?chat= link can read
+# its transcript, so files untouched for MAX_AGE_DAYS are deleted (0 keeps them forever)
+TRANSCRIPT_DIR = pathlib.Path(os.getenv("COACH_TRANSCRIPT_DIR",
+                                        pathlib.Path(__file__).resolve().parent.parent / "transcripts"))
+MAX_AGE_DAYS = float(os.getenv("COACH_TRANSCRIPT_MAX_AGE_DAYS", "30"))
+
+_ID = re.compile(r"^[0-9a-f]{12}$")
+_lock = threading.Lock()
+
+def new_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+def valid_id(chat_id) -> bool:
+    # Ids come from the URL, so only ever accept our own format as a file name
+    return isinstance(chat_id, str) and bool(_ID.match(chat_id))
+
+class Transcript:
+    """The coach conversation as shown to the user: an append-only list of (role, text).
+
+    Kept apart from the model context (core.coach), which is trimmed and summarized.
+    Every append is one JSON line added to the conversation's file, so a reconnecting
+    session reloads the chat from disk instead of from a model object. The file is only
+    created by the first user message; a greeting nobody answered is never written.
+    """
+
+    def __init__(self, chat_id: str, messages: list[tuple[str, str]] | None = None):
+        self.chat_id = chat_id
+        self.messages = messages or []
+        self._written = 0  # messages already in the file
+
+    @property
+    def path(self) -> pathlib.Path:
+        return TRANSCRIPT_DIR / f"{self.chat_id}.jsonl"
+
+    @classmethod
+    def load(cls, chat_id: str) -> "Transcript":
+        """The stored conversation, or an empty one. Unreadable lines are skipped."""
+        transcript = cls(chat_id)
+        if valid_id(chat_id) and transcript.path.exists():
+            for line in transcript.path.read_text(encoding="utf-8").splitlines():
+                try:
+                    role, text = json.loads(line)
+                except ValueError:
+                    continue
+                transcript.messages.append((role, text))
+        transcript._written = len(transcript.messages)
+        return transcript
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def append(self, role: str, text: str):
+        self.messages.append((role, text))
+        if not valid_id(self.chat_id) or (not self._written and role != "user"):
+            return
+        lines = "".join(json.dumps(list(m), ensure_ascii=False) + "\n" for m in self.messages[self._written:])
+        with _lock:
+            if not self._written:
+                TRANSCRIPT_DIR.mkdir(parents=True, exist_ok=True)
+                prune()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+        self._written = len(self.messages)
+
+    def delete(self):
+        """Removes the stored conversation and empties this one."""
+        self.messages.clear()
+        self._written = 0
+        if valid_id(self.chat_id):
+            with _lock:
+                self.path.unlink(missing_ok=True)
+
+    def exchanges(self) -> list[tuple[str, str]]:
+        """(user message, model reply) pairs, oldest first."""
+        return [(text, self.messages[i + 1][1]) for i, (role, text) in enumerate(self.messages[:-1])
+                if role == "user" and self.messages[i + 1][0] == "model"]
+
+def retention() -> str:
+    """How long a transcript is kept, for privacy notes in the UI."""
+    return f"{MAX_AGE_DAYS:g} days" if MAX_AGE_DAYS > 0 else "until you delete it"
+
+def prune(max_age_days: float = MAX_AGE_DAYS):
+    """Deletes transcripts not written to for max_age_days; runs whenever a new one is started."""
+    if max_age_days <= 0 or not TRANSCRIPT_DIR.is_dir():
+        return
+    cutoff = time.time() - max_age_days * 86400
+    for path in TRANSCRIPT_DIR.glob("*.jsonl"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            continue  # removed by another process meanwhile
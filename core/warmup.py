@@ -0,0 +1,48 @@
+import importlib, logging, threading
+from core import metrics
+
+logger = logging.getLogger(__name__)
+
+# Imported in the background so the first visit to a chart or LLM page doesn't pay for them
+HEAVY_MODULES = ("pandas", "plotly.express", "pdfplumber", "google.generativeai")
+
+_started = False
+_lock = threading.Lock()
+
+def _build_shared():
+    from core.registry import get_catalog
+    from core.cooccurrence import get_skill_graph
+    from core.autocomplete import get_completer
+    from core.courses import get_course_index
+    from core.similarity import load_neighbors
+    catalog = get_catalog()
+    catalog.index.weights_t
+    get_skill_graph().normalized
+    get_completer()
+    get_course_index()
+    load_neighbors()
+
+def _run():
+    with metrics.span("warmup.shared_resources"):
+        try:
+            _build_shared()
+        except Exception:
+            logger.exception("Preloading shared resources failed; they will load on first use")
+    for name in HEAVY_MODULES:
+        with metrics.span(f"warmup.import.{name}"):
+            try:
+                importlib.import_module(name)
+            except ImportError as e:
+                logger.warning("Could not preload %s: %s", name, e)
+
+def start():
+    """Preloads shared resources and heavy imports in a daemon thread, once per process.
+
+    Called by app.py and by metrics.start_rerun() at the top of every page.
+    """
+    global _started
+    with _lock:
+        if _started:
+            return
+        _started = True
+    threading.Thread(target=_run, name="warmup", daemon=True).start()
@@ -0,0 +1,161 @@
+"""Offline generator for large synthetic occupation catalogs and user skill profiles.
+
+Unlike generate_dataset.py this needs no API key: it fits the weight and
+skills-per-role distributions of data/occupations_expanded.json and scales
+them up with Zipfian skill popularity and correlated skill clusters.
+
+    python generate_synthetic_dataset.py --occupations 100000 --skills 20000 --profiles 50000 --seed 7
+
+Output is streamed to disk, so memory stays flat at any scale:
+    <out>/occupations.json   same schema as data/occupations_expanded.json
+    <out>/profiles.jsonl     one {"id", "skills"} object per line
+"""
+import argparse
+import bisect
+import collections
+import itertools
+import json
+import pathlib
+import random
+
+SEED_FILE = "data/occupations_expanded.json"
+TAXONOMY_FILE = "data/skills_taxonomy.json"
+
+CLUSTERS = [
+    "Data", "Cloud", "Security", "Frontend", "Backend", "Mobile", "Design", "Marketing",
+    "Finance", "Product", "Operations", "Machine Learning", "Networking", "QA", "Healthcare IT",
+    "Embedded", "Sales Engineering", "Analytics", "Platform", "Research",
+]
+LEVELS = ["Junior", "", "Senior", "Lead", "Principal"]
+
+def fit_seed_distributions(path: str = SEED_FILE) -> dict:
+    """Empirical weight and skills-per-role distributions from the hand-made catalog."""
+    with open(path, "r", encoding="utf-8") as f:
+        seed = json.load(f)
+    weights = collections.Counter(s["weight"] for o in seed for s in o["skills_required"])
+    sizes = collections.Counter(len(o["skills_required"]) for o in seed)
+    real_skills = sorted({s["skill"] for o in seed for s in o["skills_required"]})
+    return {"weights": weights, "sizes": sizes, "real_skills": real_skills}
+
+class SkillSpace:
+    """Skill vocabulary partitioned into clusters, with Zipfian popularity inside and across clusters."""
+
+    def __init__(self, n_skills: int, rng: random.Random, real_skills: list[str], zipf_s: float = 1.1):
+        names = list(real_skills[:n_skills])
+        for i in range(len(names), n_skills):
+            names.append(f"{CLUSTERS[i % len(CLUSTERS)]} Skill {i:06d}")
+        rng.shuffle(names)
+        self.names = names
+        # Popularity rank is the shuffled position; weight ~ 1 / rank^s
+        popularity = [1 / (rank + 1) ** zipf_s for rank in range(n_skills)]
+        self.global_cum = list(itertools.accumulate(popularity))
+        self.clusters = collections.defaultdict(list)
+        for idx in range(n_skills):
+            self.clusters[rng.randrange(len(CLUSTERS))].append(idx)
+        self.cluster_cum = {
+            c: list(itertools.accumulate(popularity[i] for i in members))
+            for c, members in self.clusters.items()
+        }
+
+    def draw_global(self, rng: random.Random) -> int:
+        return bisect.bisect_left(self.global_cum, rng.random() * self.global_cum[-1])
+
+    def draw_from_cluster(self, rng: random.Random, cluster: int) -> int:
+        cum = self.cluster_cum[cluster]
+        return self.clusters[cluster][bisect.bisect_left(cum, rng.random() * cum[-1])]
+
+    def draw_set(self, rng: random.Random, size: int, home: list[int], in_cluster: float) -> list[int]:
+        picked = []
+        seen = set()
+        # Bounded retries: a tiny vocabulary may not have `size` distinct skills
+        for _ in range(size * 20):
+            if len(picked) == size:
+                break
+            if rng.random() < in_cluster:
+                idx = self.draw_from_cluster(rng, rng.choice(home))
+            else:
+                idx = self.draw_global(rng)
+            if idx not in seen:
+                seen.add(idx)
+                picked.append(idx)
+        return picked
+
+def _sampler(counter: collections.Counter):
+    values = sorted(counter)
+    cum = list(itertools.accumulate(counter[v] for v in values))
+    return lambda rng: values[bisect.bisect_left(cum, rng.random() * cum[-1])]
+
+def iter_occupations(n: int, n_skills: int = 2000, seed: int = 0, in_cluster: float = 0.8):
+    """Yields occupation dicts with correlated, Zipf-distributed skills and seed-matched weights."""
+    rng = random.Random(seed)
+    dist = fit_seed_distributions()
+    space = SkillSpace(n_skills, rng, dist["real_skills"])
+    draw_weight = _sampler(dist["weights"])
+    draw_size = _sampler(dist["sizes"])
+    cluster_ids = list(space.clusters)
+    for i in range(n):
+        home = rng.sample(cluster_ids, min(len(cluster_ids), rng.choice([1, 1, 2])))
+        skills = space.draw_set(rng, draw_size(rng), home, in_cluster)
+        # Core (in-cluster, popular) skills were drawn first and get the heaviest weights
+        weights = sorted((draw_weight(rng) for _ in skills), reverse=True)
+        level = rng.choice(LEVELS)
+        title = " ".join(p for p in [level, CLUSTERS[home[0]], "Specialist", f"{i:06d}"] if p)
+        yield {
+            "occupation": title,
+            "skills_required": [{"skill": space.names[s], "weight": w} for s, w in zip(skills, weights)],
+        }
+
+def iter_profiles(n: int, n_skills: int = 2000, seed: int = 0, alias_rate: float = 0.05):
+    """Yields {"id", "skills"} user profiles drawn from the same skill space as iter_occupations."""
+    # Same seed -> same SkillSpace as the occupation catalog, then an independent stream for users
+    rng = random.Random(seed)
+    dist = fit_seed_distributions()
+    space = SkillSpace(n_skills, rng, dist["real_skills"])
+    with open(TAXONOMY_FILE, "r", encoding="utf-8") as f:
+        aliases = list(json.load(f))
+    user_rng = random.Random(f"profiles-{seed}")
+    cluster_ids = list(space.clusters)
+    for i in range(n):
+        home = user_rng.sample(cluster_ids, min(len(cluster_ids), user_rng.choice([1, 2, 2, 3])))
+        size = min(n_skills, max(3, int(user_rng.gauss(12, 5))))
+        skills = [space.names[s] for s in space.draw_set(user_rng, size, home, 0.7)]
+        # Raw, un-normalized spellings so profiles also exercise normalize_skills
+        skills += [user_rng.choice(aliases) for _ in range(sum(user_rng.random() < alias_rate for _ in skills))]
+        yield {"id": f"user-{i:07d}", "skills": skills}
+
+def write_occupations(path: pathlib.Path, occupations) -> int:
+    """Streams occupations as a JSON array without holding the catalog in memory."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for occ in occupations:
+            if count:
+                f.write(",\n")
+            f.write(json.dumps(occ))
+            count += 1
+        f.write("\n]\n")
+    return count
+
+def write_jsonl(path: pathlib.Path, rows) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+            count += 1
+    return count
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--occupations", type=int, default=10_000)
+    parser.add_argument("--skills", type=int, default=5_000, help="size of the skill vocabulary")
+    parser.add_argument("--profiles", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="data/synthetic")
+    args = parser.parse_args()
+
+    out = pathlib.Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    n_occ = write_occupations(out / "occupations.json", iter_occupations(args.occupations, args.skills, args.seed))
+    print(f"Wrote {n_occ} occupations to {out / 'occupations.json'}")
+    n_prof = write_jsonl(out / "profiles.jsonl", iter_profiles(args.profiles, args.skills, args.seed))
+    print(f"Wrote {n_prof} profiles to {out / 'profiles.jsonl'}")
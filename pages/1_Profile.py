@@ -2,8 +2,17 @@ import streamlit as st
 from core import llm
 from core.resume import get_text
 from core.normalize import normalize_skills
-import plotly.express as px
-import pandas as pd
+from core.registry import get_catalog
+from core.scoring import rank_cached
+from core.cooccurrence import get_skill_graph
+from core.autocomplete import skill_options, skill_search
+from core import metrics, profiling
+
+metrics.start_rerun("Profile")
+profiling.begin("Profile")
+
+# One data snapshot for the whole rerun, so a hot reload can't mix two versions
+catalog = get_catalog()
 
 st.title("📝 Your Professional Profile")
 st.markdown("### Build your career profile with AI-powered analysis")
@@ -67,7 +76,7 @@ with tab1:
 
         with st.spinner("🤖 AI is analyzing your profile..."):
             raw_skills = llm.extract_skills(analysis_text)
-            skills = normalize_skills(raw_skills)
+            skills = normalize_skills(raw_skills, catalog.taxonomy)
 
         # Save comprehensive profile
         profile_data = {
@@ -87,8 +96,12 @@ with tab1:
         
         # Get strategic insights
         with st.spinner("🔍 AI is analyzing your strategic career options..."):
-            insights = llm.get_strategic_insights(skills)
-            st.session_state.insights = insights
+            try:
+                st.session_state.insights = llm.get_strategic_insights(skills)
+            except Exception:
+                # The local skill synergies in the Skills tab stand in for the AI insights
+                st.session_state.insights = None
+                st.warning("AI insights are unavailable right now; showing local skill synergies instead.")
 
 with tab2:
     st.markdown("#### Your Skills Portfolio")
@@ -103,12 +116,15 @@ with tab2:
         with col1:
             edited_skills = st.multiselect(
                 "Your current skills (add/remove as needed):",
-                options=sorted(skills + ["Python", "SQL", "JavaScript", "AWS", "Docker", "Git", 
-                              "Excel", "Tableau", "React", "Node.js", "Linux", "Agile", "Scrum"]),
+                # Keyless, so it resets to the saved skills when the search box adds one
+                options=skill_options(skills, catalog=catalog),
                 default=skills,
-                help="Start typing to add new skills not in the list"
+                help="Remove skills here; add new ones with the search box below"
             )
         
+        with col1:
+            skill_search("profile_skill_search", catalog=catalog)
+        
         with col2:
             if st.button("🔄 Update Skills"):
                 st.session_state.skills = edited_skills
@@ -124,6 +140,29 @@ with tab2:
             for i, skill in enumerate(edited_skills):
                 with cols[i % 4]:
                     st.write(f"• {skill}")
+            
+            # Local adjacency answers, available instantly while the AI insights are optional
+            index = catalog.index
+            top_roles = [m['occupation'] for m in rank_cached(edited_skills, top_k=3, index=index)]
+            st.markdown("---")
+            st.markdown("### ⚡ Skill Synergies")
+            synergies = get_skill_graph(catalog).complementary(edited_skills, n=5)
+            if synergies:
+                st.caption("Skills that most often appear alongside yours in the role catalog.")
+                for skill, strength in synergies:
+                    st.write(f"• **{skill}** ({strength:.0%} co-occurrence)")
+            else:
+                st.caption("None of your skills appear in the role catalog yet.")
+            st.markdown("### 🧭 Adjacent Career Paths")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**🔗 Roles similar to your best fits:**")
+                for role, sim in index.similar_roles(top_roles, n=4):
+                    st.write(f"• **{role}** ({sim:.0%} similar)")
+            with col2:
+                st.markdown("**🪜 Reachable with 1–2 new skills:**")
+                for r in index.reachable_roles(edited_skills, max_new=2, n=4):
+                    st.write(f"• **{r['occupation']}**: learn {', '.join(r['learn'])} ({r['score']:.0%} → {r['new_score']:.0%})")
         
         # Strategic insights display
         if st.session_state.get("insights"):
@@ -171,4 +210,7 @@ if st.session_state.get("user_profile"):
         st.metric("Skills Identified", skill_count)
         
         if skill_count > 0:
-            st.success("✅ Ready for matching!")
\ No newline at end of file
+            st.success("✅ Ready for matching!")
+
+profiling.end(skills=len(st.session_state.get("skills", [])))
+metrics.debug_panel()
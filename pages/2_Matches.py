@@ -1,11 +1,17 @@
 import streamlit as st
-from core.scoring import load_occupations, rank_roles
-from core import jobs
-from core import llm
+from core.registry import get_catalog
+from core.index import IncrementalScorer
+from core.similarity import related_skills
+from core.autocomplete import skill_options, skill_search
+from core.planner import LearningPlanner
 from core.job_scraper import job_scraper
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
+from core import metrics, profiling
+
+metrics.start_rerun("Matches")
+profiling.begin("Matches")
+
+# One data snapshot for the whole rerun, so a hot reload can't mix two versions
+catalog = get_catalog()
 
 st.title("🎯 Your Perfect Job Matches")
 st.markdown("### Discover roles that align with your unique skill profile")
@@ -21,18 +27,22 @@ if not skills:
 with st.sidebar:
     st.markdown("### 🔍 Quick Filters")
     
-    # Skills refinement
+    # Skills refinement. Keyless: when its options change it restarts from the saved
+    # skills, which every edit updates below, and the search box only writes those
     edited_skills = st.multiselect(
         "Your Skills:",
-        options=sorted(list(set(skills + ["Python", "SQL", "JavaScript", "AWS", "Docker", "Git", 
-                                        "Excel", "Tableau", "React", "Node.js", "Linux", "Agile"]))),
-        default=skills,
-        key="skills_filter"
+        options=skill_options(skills, "matches_skill_search", catalog),
+        default=skills
     )
+    skill_search("matches_skill_search", catalog=catalog)
     
     # Match filters
     min_score = st.slider("Minimum Match Score %", 0, 100, 20, 5)
     show_count = st.selectbox("Show top matches", [3, 5, 8], index=1)
+    use_related = st.toggle("🧩 Partial credit for related skills", value=True,
+                            help="Skills close to yours (e.g. MySQL if you know PostgreSQL) count partially")
+    use_implied = st.toggle("🌳 Count implied skills", value=True,
+                            help="Skills your skills imply (e.g. Python if you know Pandas) count as held")
 
 # Update session skills
 st.session_state.skills = edited_skills
@@ -42,10 +52,18 @@ if not edited_skills:
     st.error("Please select at least one skill to find matches.")
     st.stop()
 
-# Load and rank occupations
-occs = load_occupations()
-all_matches = rank_roles(edited_skills, occs, top_k=len(occs))
-filtered_matches = [m for m in all_matches if (m['score'] * 100) >= min_score][:show_count]
+# Rank occupations; the per-session scorer only rescores roles touched by skill edits
+index = catalog.index
+implied = catalog.hierarchy.implied(edited_skills) if use_implied else {}
+scoring_skills = sorted(set(edited_skills) | implied.keys())
+related = related_skills(scoring_skills) if use_related else {}
+credit = {skill: c for skill, (c, _) in related.items()}
+scorer = st.session_state.get("scorer")
+if scorer is None or scorer.index is not index:
+    scorer = st.session_state.scorer = IncrementalScorer(index, scoring_skills, credit)
+else:
+    scorer.update(scoring_skills, credit)
+filtered_matches = scorer.top(show_count, min_score=min_score / 100)
 
 st.session_state.matches = filtered_matches
 
@@ -57,11 +75,135 @@ with col2:
     best_match = max([m['score'] * 100 for m in filtered_matches]) if filtered_matches else 0
     st.metric("Best Match", f"{best_match:.0f}%")
 with col3:
-    total_careers = len([m for m in all_matches if m['score'] > 0])
+    total_careers = scorer.count_above(0)
     st.metric("Compatible Careers", total_careers)
 
 st.divider()
 
+# Each card and each job panel is a fragment: their buttons and filters rerun only
+# that card or panel, not the ranking and every other card
+@st.fragment
+def job_panel(i: int, m: dict):
+    if not st.session_state.get(f"show_jobs_{i}", False):
+        return
+    jobs = st.session_state.get(f"jobs_{i}", [])
+    if jobs:
+        st.markdown("---")
+        st.markdown(f"### 🎯 Job Opportunities for {m['occupation']}")
+        job_scraper.display_jobs(jobs, f"Jobs for {m['occupation']}", widget_key=f"{i}_{m['occupation']}",
+                                stats_key=m['occupation'])
+        
+        # Add a button to hide jobs
+        st.button("❌ Hide Jobs", key=f"hide_jobs_{i}", on_click=_hide_jobs, args=(i,))
+
+def _hide_jobs(i: int):
+    st.session_state[f"show_jobs_{i}"] = False
+
+@st.fragment
+def match_card(i: int, m: dict, scoring_skills: list, implied: dict, related: dict):
+    score_percentage = int(m['score'] * 100)
+
+    with st.container(border=True):
+        # Header with role and score
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.markdown(f"### {i+1}. {m['occupation']}")
+        with col2:
+            color = "green" if score_percentage >= 70 else "orange" if score_percentage >= 50 else "red"
+            st.markdown(f"<h3 style='color: {color}; text-align: right;'>{score_percentage}%</h3>", 
+                      unsafe_allow_html=True)
+    
+        # Progress bar
+        st.progress(score_percentage / 100, text=f"{score_percentage}% Skill Alignment")
+    
+        # Skills breakdown
+        col1, col2 = st.columns(2)
+    
+        with col1:
+            # Matching skills
+            required_skills = {s['skill']: s['weight'] for s in m["skills_required"]}
+            matching_skills = [skill for skill in scoring_skills if skill in required_skills]
+        
+            if matching_skills:
+                st.markdown("**✅ Your Matching Skills:**")
+                for skill in matching_skills[:5]:  # Show only top 5
+                    importance = required_skills[skill]
+                    stars = "⭐" * importance
+                    via = f" _(implied by {implied[skill]})_" if skill in implied else ""
+                    st.write(f"• **{skill}** {stars}{via}")
+        
+            # Near skills that earned partial credit
+            near = [(gap, related[gap][1]) for gap in m["gaps"] if gap in related]
+            if near:
+                st.markdown("**🧩 Related Skills (partial credit):**")
+                for gap, via in near[:3]:
+                    st.write(f"• ≈ **{gap}** (via {via})")
+        
+        with col2:
+            # Skill gaps
+            if m["gaps"]:
+                st.markdown("**📚 Skills to Develop:**")
+                gap_importance = {gap: next(s['weight'] for s in m["skills_required"] if s['skill'] == gap) 
+                                for gap in m["gaps"]}
+                sorted_gaps = sorted(m["gaps"], key=lambda x: gap_importance[x], reverse=True)
+            
+                for gap in sorted_gaps[:5]:  # Show only top 5
+                    importance = gap_importance[gap]
+                    urgency = "🔴 Critical" if importance >= 4 else "🟡 Important" if importance >= 3 else "🟢 Nice to have"
+                    st.write(f"• **{gap}** - {urgency}")
+            else:
+                st.success("🎉 Perfect skill alignment!")
+    
+        # Action buttons
+        st.markdown("---")
+        col1, col2, col3 = st.columns(3)
+    
+        with col1:
+            # Smart job search
+            if st.button("🔍 Smart Job Search", key=f"search_{i}", use_container_width=True):
+                with st.spinner("🔍 Searching for jobs..."):
+                    user_skills_set = set(scoring_skills)
+                    required_skills_set = set(s['skill'] for s in m["skills_required"])
+                    matching_user_skills = list(user_skills_set.intersection(required_skills_set))
+                
+                    # Create search query with role and skills
+                    search_query = f"{m['occupation']} {' '.join(matching_user_skills[:3])}"
+                
+                    # Get job recommendations
+                    jobs = job_scraper.get_professional_job_recommendations(
+                        role=search_query,
+                        skills=matching_user_skills,
+                        max_results=12,
+                        occupation=m['occupation']
+                    )
+                
+                    # Store jobs in session state for display
+                    st.session_state[f"jobs_{i}"] = jobs
+                    st.session_state[f"show_jobs_{i}"] = True
+    
+        with col2:
+            if st.button(f"🎯 Build Roadmap", key=f"roadmap_{i}"):
+                st.session_state.selected_role = m
+                st.switch_page("pages/3_Roadmap.py")
+    
+        with col3:
+            if st.button(f"📊 View Details", key=f"details_{i}"):
+                st.session_state[f"show_details_{i}"] = not st.session_state.get(f"show_details_{i}", False)
+    
+        # Expandable detailed analysis
+        if st.session_state.get(f"show_details_{i}", False):
+            with st.expander("📊 Detailed Analysis", expanded=True):
+                st.markdown(f"**All Required Skills for {m['occupation']}:**")
+                for skill_obj in m["skills_required"]:
+                    skill = skill_obj['skill']
+                    weight = skill_obj['weight']
+                    has_skill = skill in scoring_skills
+                    status = "✅" if has_skill else "❌"
+                    st.write(f"{status} **{skill}** (Importance: {weight}/5)")
+    
+        # Job search results
+        job_panel(i, m)
+
 # Match results
 if not filtered_matches:
     st.warning(f"No matches found with {min_score}% minimum score. Try lowering the threshold or adding more skills.")
@@ -70,109 +212,64 @@ else:
     st.markdown(f"### Your Top {len(filtered_matches)} Career Matches")
     
     for i, m in enumerate(filtered_matches):
-        score_percentage = int(m['score'] * 100)
-        
-        with st.container(border=True):
-            # Header with role and score
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                st.markdown(f"### {i+1}. {m['occupation']}")
-            with col2:
-                color = "green" if score_percentage >= 70 else "orange" if score_percentage >= 50 else "red"
-                st.markdown(f"<h3 style='color: {color}; text-align: right;'>{score_percentage}%</h3>", 
-                          unsafe_allow_html=True)
-            
-            # Progress bar
-            st.progress(score_percentage / 100, text=f"{score_percentage}% Skill Alignment")
-            
-            # Skills breakdown
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Matching skills
-                required_skills = {s['skill']: s['weight'] for s in m["skills_required"]}
-                matching_skills = [skill for skill in edited_skills if skill in required_skills]
-                
-                if matching_skills:
-                    st.markdown("**✅ Your Matching Skills:**")
-                    for skill in matching_skills[:5]:  # Show only top 5
-                        importance = required_skills[skill]
-                        stars = "⭐" * importance
-                        st.write(f"• **{skill}** {stars}")
-                
-            with col2:
-                # Skill gaps
-                if m["gaps"]:
-                    st.markdown("**📚 Skills to Develop:**")
-                    gap_importance = {gap: next(s['weight'] for s in m["skills_required"] if s['skill'] == gap) 
-                                    for gap in m["gaps"]}
-                    sorted_gaps = sorted(m["gaps"], key=lambda x: gap_importance[x], reverse=True)
-                    
-                    for gap in sorted_gaps[:5]:  # Show only top 5
-                        importance = gap_importance[gap]
-                        urgency = "🔴 Critical" if importance >= 4 else "🟡 Important" if importance >= 3 else "🟢 Nice to have"
-                        st.write(f"• **{gap}** - {urgency}")
-                else:
-                    st.success("🎉 Perfect skill alignment!")
-            
-            # Action buttons
-            st.markdown("---")
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                # Smart job search
-                if st.button("🔍 Smart Job Search", key=f"search_{i}", use_container_width=True):
-                    with st.spinner("🔍 Searching for jobs..."):
-                        user_skills_set = set(edited_skills)
-                        required_skills_set = set(s['skill'] for s in m["skills_required"])
-                        matching_user_skills = list(user_skills_set.intersection(required_skills_set))
-                        
-                        # Create search query with role and skills
-                        search_query = f"{m['occupation']} {' '.join(matching_user_skills[:3])}"
-                        
-                        # Get job recommendations
-                        jobs = job_scraper.get_professional_job_recommendations(
-                            role=search_query,
-                            skills=matching_user_skills,
-                            max_results=12
-                        )
-                        
-                        # Store jobs in session state for display
-                        st.session_state[f"jobs_{i}"] = jobs
-                        st.session_state[f"show_jobs_{i}"] = True
-            
-            with col2:
-                if st.button(f"🎯 Build Roadmap", key=f"roadmap_{i}"):
-                    st.session_state.selected_role = m
-                    st.switch_page("pages/3_Roadmap.py")
-            
-            with col3:
-                if st.button(f"📊 View Details", key=f"details_{i}"):
-                    st.session_state[f"show_details_{i}"] = not st.session_state.get(f"show_details_{i}", False)
-            
-            # Expandable detailed analysis
-            if st.session_state.get(f"show_details_{i}", False):
-                with st.expander("📊 Detailed Analysis", expanded=True):
-                    st.markdown(f"**All Required Skills for {m['occupation']}:**")
-                    for skill_obj in m["skills_required"]:
-                        skill = skill_obj['skill']
-                        weight = skill_obj['weight']
-                        has_skill = skill in edited_skills
-                        status = "✅" if has_skill else "❌"
-                        st.write(f"{status} **{skill}** (Importance: {weight}/5)")
-            
-            # Job search results
-            if st.session_state.get(f"show_jobs_{i}", False):
-                jobs = st.session_state.get(f"jobs_{i}", [])
-                if jobs:
-                    st.markdown("---")
-                    st.markdown(f"### 🎯 Job Opportunities for {m['occupation']}")
-                    job_scraper.display_jobs(jobs, f"Jobs for {m['occupation']}", widget_key=f"{i}_{m['occupation']}")
-                    
-                    # Add a button to hide jobs
-                    if st.button("❌ Hide Jobs", key=f"hide_jobs_{i}"):
-                        st.session_state[f"show_jobs_{i}"] = False
-                        st.rerun()
+        match_card(i, m, scoring_skills, implied, related)
+
+# Career adjacency from the precomputed role-similarity matrix (instant, no LLM call)
+if filtered_matches:
+    st.divider()
+    st.markdown("### 🧭 Explore Nearby Roles")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**🔗 Similar to your top matches:**")
+        for role, sim in index.similar_roles([m['occupation'] for m in filtered_matches[:3]], n=5):
+            st.write(f"• **{role}** ({sim:.0%} skill similarity)")
+    
+    with col2:
+        st.markdown("**🪜 Within reach with 1–2 new skills:**")
+        reachable = index.reachable_roles(scoring_skills, max_new=2, target=0.5, n=5)
+        if not reachable:
+            st.write("No roles cross 50% with two new skills yet.")
+        for r in reachable:
+            st.write(f"• **{r['occupation']}** {r['score']:.0%} → {r['new_score']:.0%} by learning {', '.join(r['learn'])}")
+
+# Learning optimizer over the top roles; what-if toggles only touch that skill's column,
+# and the budget slider and what-if picker rerun only this section
+@st.fragment
+def learning_plan(index, scoring_skills: list):
+    st.divider()
+    st.markdown("### 🎯 What to Learn Next")
+    planner_key = (index.version, tuple(scoring_skills))
+    if st.session_state.get("planner_key") != planner_key:
+        st.session_state.planner = LearningPlanner(index, scoring_skills, top_k=10)
+        st.session_state.planner_key = planner_key
+        st.session_state.planner_assumed = set()
+    planner = st.session_state.planner
+    
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        budget = st.slider("Skills to learn", 1, 3, 2, key="planner_budget")
+    with col2:
+        candidates = [s for s, owned in zip(planner.skills, planner.owned) if not owned or s in st.session_state.planner_assumed]
+        assumed = set(st.multiselect("What if I already knew…", sorted(candidates), key="planner_whatif"))
+    for skill in assumed ^ st.session_state.planner_assumed:
+        planner.toggle(skill, skill in assumed)
+    st.session_state.planner_assumed = assumed
+    
+    plan = planner.plan(budget)
+    if not plan:
+        st.success("🎉 Your top roles are already at or above 80% - no single skill adds more.")
+    for step, p in enumerate(plan, 1):
+        st.write(f"{step}. **{p['skill']}** (+{p['gain']:.1%} average across your top {len(planner.roles)} roles) "
+                 f"- helps {', '.join(p['roles'][:3])}")
+    if plan:
+        with st.expander("📈 Projected scores after this plan"):
+            for role, before, after in planner.projected(plan):
+                if after > before:
+                    st.write(f"• **{role}**: {before:.0%} → {after:.0%}")
+
+if filtered_matches:
+    learning_plan(index, scoring_skills)
 
 # Action buttons at bottom
 st.divider()
@@ -193,3 +290,6 @@ with col2:
 with col3:
     if st.button("🤖 AI Career Coach", use_container_width=True):
         st.switch_page("pages/4_AI_Coach.py")
+
+profiling.end(skills=len(edited_skills), occupations=len(index.occupations))
+metrics.debug_panel()
@@ -1,12 +1,12 @@
 import streamlit as st
 from core.scoring import skill_gaps
 from core import llm
-from core.courses import links_for_gap
+from core.courses import links_for_gap, get_course_index
 from core.job_scraper import job_scraper
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
-from datetime import datetime, timedelta
+from core import metrics, profiling
+
+metrics.start_rerun("Roadmap")
+profiling.begin("Roadmap")
 
 st.title("🗺️ Your Personalized Learning Roadmap")
 st.markdown("### Transform your career with AI-guided learning paths")
@@ -93,83 +93,98 @@ if st.button("🚀 Generate Personalized Roadmap", type="primary"):
         - Duration: {timeline_weeks} weeks
         """
         
-        roadmap = llm.generate_roadmap(
-            profile={"skills": skills, "context": context}, 
-            target_role=choice, 
-            gaps=gaps, 
-            hours=hours_per_week, 
-            style=learning_style
-        )
-        st.session_state.roadmap = roadmap
-        st.session_state.roadmap_target = choice
-        st.session_state.roadmap_config = {
-            "hours": hours_per_week,
-            "weeks": timeline_weeks,
-            "style": learning_style
-        }
+        try:
+            roadmap = llm.generate_roadmap(
+                profile={"skills": skills, "context": context}, 
+                target_role=choice, 
+                gaps=gaps, 
+                hours=hours_per_week, 
+                style=learning_style,
+                weeks=timeline_weeks
+            )
+        except ValueError:
+            st.error("The AI returned a roadmap we couldn't read. Please try generating it again.")
+        else:
+            st.session_state.roadmap = roadmap
+            st.session_state.roadmap_progress = {}
+            st.session_state.roadmap_target = choice
+            st.session_state.roadmap_config = {
+                "hours": hours_per_week,
+                "weeks": timeline_weeks,
+                "style": learning_style
+            }
+
+def show_progress(slots, roadmap):
+    completed_tasks, total_tasks = roadmap.progress(st.session_state.roadmap_progress)
+    completion_rate = (completed_tasks / max(total_tasks, 1)) * 100
+    metric_slot, bar_slot = slots
+    metric_slot.metric("Progress", f"{completion_rate:.0f}%")
+    bar_slot.progress(completion_rate / 100, text=f"Completed {completed_tasks}/{total_tasks} tasks")
+
+# Each week is a fragment: ticking a task reruns that week and refreshes the progress
+# placeholders above it, not the whole page
+@st.fragment
+def roadmap_week(roadmap, week: dict, slots):
+    progress_data = st.session_state.roadmap_progress
+    st.markdown(f"### Week {week['week']}" + (f": {week['title']}" if week['title'] else ""))
+    for task in week["tasks"]:
+        col1, col2 = st.columns([1, 10])
+        with col1:
+            completed = st.checkbox(task["text"], key=f"task_{roadmap.key}_{task['id']}",
+                                    value=progress_data.get(task["id"], False), label_visibility="collapsed")
+            progress_data[task["id"]] = completed
+        
+        with col2:
+            if completed:
+                st.markdown(f"~~{task['text']}~~ ✅")
+            else:
+                st.markdown(task["text"])
+            if task["resources"]:
+                st.caption(" · ".join(f"[{r['title']}]({r['url']})" if r["url"] else r["title"]
+                                      for r in task["resources"]))
+    if week["notes"]:
+        st.markdown(week["notes"])
+    show_progress(slots, roadmap)
 
 # Display roadmap with progress tracking
 if st.session_state.get("roadmap"):
+    roadmap = st.session_state.roadmap
     st.divider()
-    st.markdown("## 📋 Your Learning Roadmap")
+    st.markdown(f"## 📋 {roadmap.title or 'Your Learning Roadmap'}")
+    if roadmap.summary:
+        st.markdown(roadmap.summary)
     
-    # Progress overview
+    # Progress overview; the progress cells are placeholders the week fragments refresh
     col1, col2, col3 = st.columns(3)
     
-    progress_data = st.session_state.roadmap_progress
-    completed_tasks = sum(1 for task_id, completed in progress_data.items() if completed)
-    total_tasks = len(progress_data) if progress_data else 6 * 4  # Estimate 4 tasks per week
-    
     with col1:
-        st.metric("Weeks in Plan", st.session_state.roadmap_config.get("weeks", 6))
+        st.metric("Weeks in Plan", len(roadmap))
     with col2:
         st.metric("Hours/Week", st.session_state.roadmap_config.get("hours", 8))
-    with col3:
-        completion_rate = (completed_tasks / max(total_tasks, 1)) * 100
-        st.metric("Progress", f"{completion_rate:.0f}%")
-    
-    # Progress bar
-    if total_tasks > 0:
-        st.progress(completion_rate / 100, text=f"Completed {completed_tasks}/{total_tasks} tasks")
+    progress_slots = (col3.empty(), st.empty())
+    show_progress(progress_slots, roadmap)
     
     # Roadmap content with checkboxes
-    roadmap_lines = st.session_state.roadmap.split('\n')
-    current_week = None
-    task_counter = 0
-    
-    for line in roadmap_lines:
-        if line.strip().startswith('##') and 'Week' in line:
-            current_week = line.strip()
-            st.markdown(f"### {current_week.replace('##', '').strip()}")
-            
-        elif line.strip().startswith('-') or line.strip().startswith('*'):
-            task_counter += 1
-            task_id = f"task_{task_counter}"
-            task_text = line.strip().lstrip('- *').strip()
-            
-            if task_text:
-                col1, col2 = st.columns([1, 10])
-                with col1:
-                    completed = st.checkbox("", key=task_id, 
-                                          value=progress_data.get(task_id, False))
-                    progress_data[task_id] = completed
-                    st.session_state.roadmap_progress = progress_data
-                
-                with col2:
-                    if completed:
-                        st.markdown(f"~~{task_text}~~ ✅")
-                    else:
-                        st.markdown(task_text)
-        else:
-            if line.strip():
-                st.markdown(line)
+    for week in roadmap.weeks:
+        roadmap_week(roadmap, week, progress_slots)
     
 
-# Interactive skill modules
-if gaps:
+# Interactive skill modules; the course filters rerun only this section
+@st.fragment
+def learning_resources(choice: str, gaps: list):
     st.divider()
     st.markdown("## 🎓 Learning Resources")
     
+    col1, col2 = st.columns(2)
+    with col1:
+        max_course_hours = st.select_slider("Max course length (hours)", [5, 10, 20, 50, 100, 500], value=50)
+    with col2:
+        free_only = st.toggle("Free courses only", value=False)
+    
+    # One batched query over the local course catalog for every gap shown
+    courses = get_course_index().search_many(gaps[:3], n=3, max_hours=max_course_hours,
+                                             max_cost=0 if free_only else None)
+    
     # Show top 3 skill gaps with simple resources
     for i, gap in enumerate(gaps[:3]):
         with st.expander(f"📚 Learn {gap}", expanded=False):
@@ -177,13 +192,24 @@ if gaps:
             
             # Learning resources
             st.markdown("**📖 Recommended Resources:**")
-            resource_links = links_for_gap(gap)
+            for course in courses[gap]:
+                col1, col2 = st.columns([4, 1])
+                with col1:
+                    cost = "Free" if not course.get("cost") else f"${course['cost']:g}"
+                    st.markdown(f"**{course['title']}** · {course['provider']}  \n"
+                                f"⏱️ ~{course['hours']:g}h · 💵 {cost} · {course.get('level', '')}")
+                with col2:
+                    st.link_button("Open", course["url"], use_container_width=True)
             
-            cols = st.columns(min(len(resource_links), 3))
-            for j, (platform, link) in enumerate(resource_links.items()):
-                if j < 3:  # Show only first 3 resources
-                    with cols[j]:
-                        st.link_button(f"{platform}", link, use_container_width=True)
+            if not courses[gap]:
+                # Nothing local fits; fall back to search links
+                resource_links = links_for_gap(gap)
+                
+                cols = st.columns(min(len(resource_links), 3))
+                for j, (platform, link) in enumerate(resource_links.items()):
+                    if j < 3:  # Show only first 3 resources
+                        with cols[j]:
+                            st.link_button(f"{platform}", link, use_container_width=True)
             
             # Simple practice ideas
             st.markdown("**💪 Practice Ideas:**")
@@ -191,6 +217,34 @@ if gaps:
             st.write(f"• Build a small project using {gap}")
             st.write(f"• Join {gap} communities for support")
 
+if gaps:
+    learning_resources(choice, gaps)
+
+# The job search, its filters and "Hide Jobs" rerun only this panel
+@st.fragment
+def job_panel(choice: str, matching_skills: list):
+    if st.button("🔍 Find Jobs", use_container_width=True):
+        with st.spinner("🔍 Searching for jobs..."):
+            search_query = f"{choice} {' '.join(matching_skills[:3])}"
+            jobs = job_scraper.get_professional_job_recommendations(
+                role=search_query,
+                skills=matching_skills,
+                max_results=10,
+                occupation=choice
+            )
+            st.session_state.roadmap_jobs = jobs
+            st.session_state.show_roadmap_jobs = True
+    
+    if st.session_state.get("show_roadmap_jobs", False):
+        jobs = st.session_state.get("roadmap_jobs", [])
+        if jobs:
+            st.markdown("**Recent Job Opportunities:**")
+            job_scraper.display_jobs(jobs, f"Jobs for {choice}", stats_key=choice)
+            st.button("❌ Hide Jobs", on_click=_hide_jobs)
+
+def _hide_jobs():
+    st.session_state.show_roadmap_jobs = False
+
 # Career preparation tools
 st.divider()
 st.markdown("## 🚀 Career Preparation Tools")
@@ -225,27 +279,7 @@ with col3:
     user_skills_set = set(skills)
     required_skills_set = set(s['skill'] for s in target['skills_required'])
     matching_skills = list(user_skills_set.intersection(required_skills_set))
-    
-    if st.button("🔍 Find Jobs", use_container_width=True):
-        with st.spinner("🔍 Searching for jobs..."):
-            search_query = f"{choice} {' '.join(matching_skills[:3])}"
-            jobs = job_scraper.get_professional_job_recommendations(
-                role=search_query,
-                skills=matching_skills,
-                max_results=10
-            )
-            st.session_state.roadmap_jobs = jobs
-            st.session_state.show_roadmap_jobs = True
-    
-    if st.session_state.get("show_roadmap_jobs", False):
-        jobs = st.session_state.get("roadmap_jobs", [])
-        if jobs:
-            st.markdown("**Recent Job Opportunities:**")
-            job_scraper.display_jobs(jobs, f"Jobs for {choice}")
-            
-            if st.button("❌ Hide Jobs"):
-                st.session_state.show_roadmap_jobs = False
-                st.rerun()
+    job_panel(choice, matching_skills)
 
 # Action buttons
 st.divider()
@@ -263,4 +297,7 @@ with col2:
 
 with col3:
     if st.button("🤖 Ask AI Coach", use_container_width=True):
-        st.switch_page("pages/4_AI_Coach.py")
\ No newline at end of file
+        st.switch_page("pages/4_AI_Coach.py")
+
+profiling.end(skills=len(skills), gaps=len(gaps))
+metrics.debug_panel()
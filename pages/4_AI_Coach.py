@@ -1,5 +1,10 @@
 import streamlit as st
-from core.llm import MODEL
+from core.coach import CoachContext
+from core.transcripts import Transcript, new_id, retention, valid_id
+from core import metrics, profiling
+
+metrics.start_rerun("AI Coach")
+profiling.begin("AI Coach")
 
 st.title("🤖 AI Career Coach")
 st.info("Ask me anything about your career goals, skills, or learning roadmap!")
@@ -10,12 +15,22 @@ if not st.session_state.get("skills"):
         st.switch_page("pages/1_Profile.py")
     st.stop()
 
-if "ai_coach_setup" not in st.session_state:
+# The conversation id lives in the URL (?chat=...), so a reconnecting session or a
+# refreshed tab reloads its transcript from disk
+chat_id = st.query_params.get("chat")
+transcript = st.session_state.get("transcript")
+if transcript is None or (valid_id(chat_id) and chat_id != transcript.chat_id):
+    transcript = st.session_state.transcript = Transcript.load(chat_id if valid_id(chat_id) else new_id())
+    st.session_state.pop("coach", None)
+st.query_params["chat"] = transcript.chat_id
+
+if "coach" not in st.session_state:
     profile = st.session_state.get("user_profile", {})
     target_role = "your target role"
     if st.session_state.get("matches"):
         target_role = st.session_state.matches[0]['occupation']
-    roadmap = st.session_state.get("roadmap", "No roadmap has been generated yet.")
+    roadmap = st.session_state.get("roadmap")
+    roadmap = roadmap.to_markdown() if roadmap else "No roadmap has been generated yet."
 
     system_prompt = f"""
 You are "Career Coach", an expert AI career advisor. You are speaking to {profile.get('name', 'a user')}.
@@ -30,29 +45,54 @@ Instructions:
 2. Provide specific, actionable advice
 3. Focus on career, skills, and job searching topics
 4. Don't repeat their data back to them
-
-Start by introducing yourself and asking how you can help with their career journey.
 """
-    st.session_state.chat_session = MODEL.start_chat(history=[])
-    with st.spinner("Setting up your AI coach..."):
-        st.session_state.chat_session.send_message(system_prompt)
-    st.session_state.ai_coach_setup = True
+    # The prompt is the model's system instruction, so setting up the coach makes no request
+    st.session_state.coach = CoachContext(system_prompt)
+    if transcript:
+        st.session_state.coach.restore(transcript.exchanges())
+    else:
+        greeting_name = f" {profile['name']}" if profile.get('name') else ""
+        if st.session_state.get("matches"):
+            goal = f"I know your skills and your goal of becoming a {target_role}."
+        else:
+            goal = "I know your skills, and I can help you pick a target role."
+        transcript.append("model", f"Hi{greeting_name}! I'm your Career Coach. {goal} "
+                                   "How can I help with your career journey today?")
+
+st.caption(f"💾 This conversation is saved for {retention()} once you send a message; anyone with this "
+           f"page's link can reopen it.")
+if st.button("🗑️ Delete conversation"):
+    transcript.delete()
+    st.session_state.pop("transcript", None)
+    st.session_state.pop("coach", None)
+    del st.query_params["chat"]
+    st.rerun()
+
+# History up to this full rerun is drawn once, outside the fragment
+shown = len(transcript)
+for role, text in transcript.messages[:shown]:
+    with st.chat_message(role):
+        st.markdown(text)
+
+# The chat input is a fragment: sending a message reruns only this part and draws only
+# the messages added since the last full rerun
+@st.fragment
+def chat_area(transcript, shown: int):
+    for role, text in transcript.messages[shown:]:
+        with st.chat_message(role):
+            st.markdown(text)
     
-if "chat_session" in st.session_state:
-    for message in st.session_state.chat_session.history:
-        # Filter out the initial system prompt from the displayed history
-        if message.role == "user" and "USER'S CONTEXT" in message.parts[0].text:
-            continue
-        with st.chat_message(message.role):
-            st.markdown(message.parts[0].text)
-
-if prompt := st.chat_input("What would you like to discuss?"):
-    with st.chat_message("user"):
-        st.markdown(prompt)
-    with st.spinner("Thinking..."):
-        response = st.session_state.chat_session.send_message(prompt)
-    with st.chat_message("model"):
-        st.markdown(response.text)
+    if prompt := st.chat_input("What would you like to discuss?"):
+        with st.chat_message("user"):
+            st.markdown(prompt)
+        with st.spinner("Thinking..."):
+            reply = st.session_state.coach.send(prompt)
+        with st.chat_message("model"):
+            st.markdown(reply)
+        transcript.append("user", prompt)
+        transcript.append("model", reply)
+
+chat_area(transcript, shown)
 
 # Quick action buttons
 st.divider()
@@ -68,4 +108,7 @@ with col2:
 
 with col3:
     if st.button("🗺️ Create Roadmap", use_container_width=True):
-        st.switch_page("pages/3_Roadmap.py")
\ No newline at end of file
+        st.switch_page("pages/3_Roadmap.py")
+
+profiling.end(skills=len(st.session_state.get("skills", [])), messages=len(transcript))
+metrics.debug_panel()
@@ -1,17 +1,21 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-import numpy as np
-from core.scoring import load_occupations
-from datetime import datetime, timedelta
-import random
+from core.registry import get_catalog
+from core.salary import salary_stats
+from core.charts import bar_chart
+from core.market import get_market_summary
+from core import metrics, profiling
+
+metrics.start_rerun("Market Insights")
+profiling.begin("Market Insights")
 
 st.title("📊 Market Insights")
 st.markdown("### Key career opportunities and market trends")
 
 # Load data
-occupations = load_occupations()
+# One data snapshot for the whole rerun, so a hot reload can't mix two versions
+catalog = get_catalog()
+occupations = catalog.occupations
+market = get_market_summary(catalog)
 user_skills = st.session_state.get("skills", [])
 
 if not occupations:
@@ -43,11 +47,7 @@ with tab1:
     with col1:
         st.metric("Total Career Paths", len(occupations))
     with col2:
-        all_skills = set()
-        for occ in occupations:
-            for skill_obj in occ.get('skills_required', []):
-                all_skills.add(skill_obj['skill'])
-        st.metric("Unique Skills Tracked", len(all_skills))
+        st.metric("Unique Skills Tracked", market['unique_skills'])
     with col3:
         if user_skills:
             user_role_matches = sum(1 for occ in occupations 
@@ -60,29 +60,9 @@ with tab1:
     # Top skills chart
     st.markdown("### 🔥 Most In-Demand Skills")
     
-    skill_counts = {}
-    for occ in occupations:
-        for skill_obj in occ.get('skills_required', []):
-            skill = skill_obj['skill']
-            if skill in skill_counts:
-                skill_counts[skill] += 1
-            else:
-                skill_counts[skill] = 1
-    
-    # Create distribution chart
-    popularity_df = pd.DataFrame([
-        {'Skill': skill, 'Frequency': count}
-        for skill, count in skill_counts.items()
-    ]).sort_values('Frequency', ascending=False).head(10)
-    
-    fig_popularity = px.bar(
-        popularity_df,
-        x='Frequency',
-        y='Skill',
-        orientation='h',
-        title="Top 10 Most Required Skills"
-    )
-    fig_popularity.update_layout(yaxis={'categoryorder':'total ascending'})
+    # Counts are computed once per data snapshot and the figure comes from the shared cache
+    fig_popularity = bar_chart(market['top_skills'], x='Frequency', y='Skill',
+                               title="Top 10 Most Required Skills")
     st.plotly_chart(fig_popularity, use_container_width=True)
 
 with tab2:
@@ -100,18 +80,15 @@ with tab2:
                 
                 with col1:
                     # Skills breakdown
-                    skills_df = pd.DataFrame(role['skills_required']).sort_values('weight', ascending=False)
-                    
-                    fig_skills = px.bar(
-                        skills_df.head(10),  # Show only top 10 skills
+                    top_skills = sorted(role['skills_required'], key=lambda s: -s['weight'])[:10]
+                    fig_skills = bar_chart(
+                        [{'skill': s['skill'], 'weight': s['weight']} for s in top_skills],
                         x='weight',
                         y='skill',
-                        orientation='h',
                         color='weight',
                         title=f"Top Skills for {role_name}",
                         color_continuous_scale='Viridis'
                     )
-                    fig_skills.update_layout(yaxis={'categoryorder':'total ascending'})
                     st.plotly_chart(fig_skills, use_container_width=True)
                 
                 with col2:
@@ -140,34 +117,7 @@ with tab3:
     # Simulated salary data based on skill complexity
     st.info("💡 Salary estimates are based on skill complexity and market demand")
     
-    salary_data = []
-    for occ in occupations:
-        # Calculate salary based on skills complexity and market demand
-        skill_complexity = sum(s['weight'] for s in occ['skills_required'])
-        num_skills = len(occ['skills_required'])
-        
-        # Base salary calculation (simulated)
-        base_salary = 45000 + (skill_complexity * 6000) + (num_skills * 2500)
-        
-        # Add some randomization for realism
-        variation = random.uniform(0.85, 1.15)
-        estimated_salary = int(base_salary * variation)
-        
-        # Skill premium calculation
-        premium_skills = ['AI', 'Machine Learning', 'AWS', 'Kubernetes', 'React', 'Python']
-        has_premium = any(premium in [s['skill'] for s in occ['skills_required']] 
-                         for premium in premium_skills)
-        
-        if has_premium:
-            estimated_salary = int(estimated_salary * 1.2)
-        
-        salary_data.append({
-            'Role': occ['occupation'],
-            'Estimated_Salary': estimated_salary,
-            'Has_Premium_Skills': has_premium
-        })
-    
-    salary_df = pd.DataFrame(salary_data).sort_values('Estimated_Salary', ascending=False)
+    salary_rows = market['salaries']
     
     # Salary visualization
     col1, col2 = st.columns([2, 1])
@@ -175,32 +125,41 @@ with tab3:
     with col1:
         st.markdown("### 📊 Top Paying Roles")
         
-        fig_salary = px.bar(
-            salary_df.head(10),  # Show only top 10
+        fig_salary = bar_chart(
+            salary_rows[:10],  # Show only top 10
             x='Estimated_Salary',
             y='Role',
             color='Has_Premium_Skills',
             title="Top 10 Highest Paying Roles",
             color_discrete_map={True: '#4CAF50', False: '#FFA726'}
         )
-        fig_salary.update_layout(yaxis={'categoryorder':'total ascending'})
         st.plotly_chart(fig_salary, use_container_width=True)
     
     with col2:
         st.markdown("### 💎 Key Insights")
         
-        highest_salary = salary_df.iloc[0]
+        highest_salary = salary_rows[0]
         st.metric("Highest Paying Role", highest_salary['Role'])
         st.metric("Top Salary", f"${highest_salary['Estimated_Salary']:,}")
-        
-        avg_salary = salary_df['Estimated_Salary'].mean()
-        st.metric("Market Average", f"${avg_salary:,.0f}")
-        
-        premium_avg = salary_df[salary_df['Has_Premium_Skills']]['Estimated_Salary'].mean()
-        regular_avg = salary_df[~salary_df['Has_Premium_Skills']]['Estimated_Salary'].mean()
-        premium_boost = ((premium_avg - regular_avg) / regular_avg) * 100
-        
-        st.metric("Premium Skills Boost", f"+{premium_boost:.0f}%")
+        st.metric("Market Average", f"${market['average_salary']:,.0f}")
+        st.metric("Premium Skills Boost", f"+{market['premium_boost']:.0f}%")
+    
+    # Distributions from job postings ingested so far (shared across sessions)
+    st.markdown("### 📈 Observed Posting Salaries")
+    role_rows = salary_stats.summary(by="role")
+    if not role_rows:
+        st.caption("Run a job search on the Matches or Roadmap page to start collecting posting salaries.")
+    else:
+        import pandas as pd
+        col1, col2 = st.columns(2)
+        money = {c: st.column_config.NumberColumn(c, format="$%d") for c in ["p25", "p50", "p90"]}
+        with col1:
+            st.markdown("**By Role**")
+            st.dataframe(pd.DataFrame(role_rows), hide_index=True, column_config=money, use_container_width=True)
+        with col2:
+            st.markdown("**By Location**")
+            st.dataframe(pd.DataFrame(salary_stats.summary(by="location")), hide_index=True,
+                         column_config=money, use_container_width=True)
 
 # Bottom action panel
 st.divider()
@@ -218,4 +177,7 @@ with col2:
 
 with col3:
     if st.button("🗺️ Create Learning Plan", use_container_width=True):
-        st.switch_page("pages/3_Roadmap.py")
\ No newline at end of file
+        st.switch_page("pages/3_Roadmap.py")
+
+profiling.end(occupations=len(occupations), roles=len(selected_roles))
+metrics.debug_panel()